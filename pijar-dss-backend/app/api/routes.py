@@ -5,7 +5,7 @@ Defines all REST endpoints for the Pijar DSS backend.
 """
 
 from fastapi import APIRouter, HTTPException, BackgroundTasks
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 import time
 from datetime import datetime
 from typing import Optional
@@ -206,7 +206,7 @@ async def run_simulation(request: SimulationRequest):
                         p95=p.p95
                     ) for p in basic_result.paths.percentiles
                 ],
-                sample_paths=basic_result.paths.sample_paths or [],
+                sample_paths=basic_result.paths.sample_paths,
                 median_path=basic_result.paths.median_path,
             ),
             outcomes=OutcomeResponse(
@@ -320,7 +320,13 @@ async def run_simulation(request: SimulationRequest):
             )
         )
         
-        return response
+        # The model is already validated: serialize it to JSON bytes in
+        # one pydantic-core pass instead of having FastAPI re-validate and
+        # re-encode the (large) path and analytics payload
+        return Response(
+            content=response.model_dump_json(),
+            media_type="application/json"
+        )
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
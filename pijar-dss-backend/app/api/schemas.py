@@ -9,6 +9,8 @@ from pydantic import BaseModel, Field
 from typing import List, Dict, Optional, Any
 from datetime import datetime
 
+from ..core.models.results import Float32Matrix, Float32Vector
+
 
 # ============== REQUEST SCHEMAS ==============
 
@@ -129,8 +131,8 @@ class PathPercentileResponse(BaseModel):
 class PathDataResponse(BaseModel):
     """Path data for visualization."""
     percentiles: List[PathPercentileResponse]
-    sample_paths: List[List[float]]
-    median_path: List[float]
+    sample_paths: Float32Matrix
+    median_path: Float32Vector
 
 
 class OutcomeResponse(BaseModel):
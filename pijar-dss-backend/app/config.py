@@ -35,6 +35,10 @@ class Settings(BaseSettings):
     # -1 means use all available CPU cores
     n_jobs: int = -1
     
+    # Compile the Numba kernels at startup rather than on the first
+    # simulation request
+    jit_warmup: bool = True
+    
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
@@ -382,8 +382,9 @@ class RiskAnalyzer:
         Even successful ventures spend time "underwater" during
         development and early growth. This quantifies that experience.
         """
-        # Underwater mask: capital < initial
-        underwater = self.equity_curves < self.initial_capitals.reshape(-1, 1)
+        # Underwater mask: capital < initial (at the curves' precision)
+        initial = self.initial_capitals.astype(self.equity_curves.dtype)
+        underwater = self.equity_curves < initial.reshape(-1, 1)
         
         # Total months underwater per path
         months_underwater = np.sum(underwater, axis=1)
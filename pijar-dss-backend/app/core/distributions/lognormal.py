@@ -39,9 +39,16 @@ import numpy as np
 from numpy.random import Generator
 from numpy.typing import NDArray
 from scipy import stats
-from typing import Union, Optional
+from typing import Union, Optional, Tuple
 
 from .base import BaseDistribution
+from ...utils.jit import vectorize
+
+
+@vectorize(['float64(float64, float64, float64)'])
+def _lognormal_transform(z, mu, sigma):
+    """Map a standard normal draw z to LogNormal(mu, sigma): exp(mu + sigma·z)."""
+    return np.exp(mu + sigma * z)
 
 
 class LogNormalDistribution(BaseDistribution):
@@ -104,9 +111,36 @@ class LogNormalDistribution(BaseDistribution):
         -------
         LogNormalDistribution
         """
-        if mean <= 0:
+        mu, sigma = cls.log_params_from_mean_cv(mean, cv)
+        return cls(mu=mu, sigma=sigma)
+    
+    @staticmethod
+    def log_params_from_mean_cv(
+        mean: Union[float, NDArray],
+        cv: Union[float, NDArray]
+    ) -> Tuple[Union[float, NDArray], Union[float, NDArray]]:
+        """
+        Log-space (mu, sigma) for a given mean and coefficient of variation.
+        
+        The conversion behind ``from_mean_cv``, usable on arrays: with
+        one mean per path it gives every path's parameters in a single
+        vectorized step, without building distribution objects.
+        
+        Parameters
+        ----------
+        mean : float or NDArray
+            Desired mean(s) (> 0)
+        cv : float or NDArray
+            Coefficient(s) of variation (> 0)
+            
+        Returns
+        -------
+        tuple
+            (mu, sigma), broadcast like ``mean`` and ``cv``
+        """
+        if np.any(np.asarray(mean) <= 0):
             raise ValueError(f"mean must be > 0, got {mean}")
-        if cv <= 0:
+        if np.any(np.asarray(cv) <= 0):
             raise ValueError(f"cv must be > 0, got {cv}")
         
         # Derive log-space parameters from mean and CV
@@ -114,7 +148,7 @@ class LogNormalDistribution(BaseDistribution):
         sigma = np.sqrt(sigma_sq)
         mu = np.log(mean) - sigma_sq / 2
         
-        return cls(mu=mu, sigma=sigma)
+        return mu, sigma
     
     @classmethod
     def from_mean_std(cls, mean: float, std: float) -> 'LogNormalDistribution':
@@ -185,9 +219,10 @@ class LogNormalDistribution(BaseDistribution):
         if rng is None:
             rng = np.random.default_rng()
         
-        # Sample from normal, then exponentiate
-        normal_samples = rng.normal(loc=self.mu, scale=self.sigma, size=size)
-        return np.exp(normal_samples)
+        # Sample a standard normal, then shift, scale and exponentiate
+        return _lognormal_transform(
+            rng.standard_normal(size), self.mu, self.sigma
+        )
     
     def pdf(self, x: NDArray) -> NDArray:
         """Probability density function."""
@@ -34,6 +34,20 @@ from scipy import stats
 from typing import Union, Optional
 
 from .base import BaseDistribution
+from ...utils.jit import vectorize
+
+
+@vectorize(['float64(float64, float64, float64, float64)'])
+def _triangular_icdf(u, left, mode, right):
+    """Inverse CDF of Triangular(left, mode, right) at u in [0, 1)."""
+    base = right - left
+    lower = left + np.sqrt(u * (mode - left) * base)
+    upper = right - np.sqrt((1.0 - u) * (right - mode) * base)
+    # Branch-free select so the undecorated function broadcasts too.
+    # Comparing u * base rather than dividing by base keeps the
+    # degenerate left == right case finite (it yields left).
+    in_lower = u * base <= mode - left
+    return lower * in_lower + upper * (1 - in_lower)
 
 
 class TriangularDistribution(BaseDistribution):
@@ -109,12 +123,10 @@ class TriangularDistribution(BaseDistribution):
         if rng is None:
             rng = np.random.default_rng()
         
-        # Use numpy's built-in triangular (more efficient than scipy)
-        return rng.triangular(
-            left=self.min_val,
-            mode=self.mode,
-            right=self.max_val,
-            size=size
+        # Same uniform draws and inverse CDF as rng.triangular, but the
+        # transform is a compiled ufunc that njit kernels can call too
+        return _triangular_icdf(
+            rng.random(size), self.min_val, self.mode, self.max_val
         )
     
     def pdf(self, x: NDArray) -> NDArray:
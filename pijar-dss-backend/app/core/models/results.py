@@ -5,9 +5,49 @@ Defines the structure for simulation outputs, including summary
 statistics, paths, risk metrics, and premortem analysis.
 """
 
-from pydantic import BaseModel, Field
-from typing import List, Dict, Optional, Any
+from pydantic import BaseModel, BeforeValidator, Field, PlainSerializer, WithJsonSchema
+from typing import Annotated, List, Dict, Optional, Any
 from enum import Enum
+import numpy as np
+import orjson
+
+
+def _as_float32(value: Any) -> np.ndarray:
+    """Coerce a list or array (``None`` meaning empty) to a float32 array."""
+    return np.asarray(value if value is not None else [], dtype=np.float32)
+
+
+# No return annotation: pydantic would take it as the serialized type and
+# let it replace the documented JSON schema in serialization mode
+def _float32_to_list(value: np.ndarray):
+    """
+    Nested lists of a float32 array, as the shortest float32 decimals.
+    
+    ``tolist()`` widens each element to float64, whose repr carries the
+    float32 rounding (5234.7427 becomes 5234.74267578125). orjson writes
+    float32 with its shortest round-trip repr, and parsing that back
+    gives the floats that print as those decimals.
+    """
+    return orjson.loads(
+        orjson.dumps(np.ascontiguousarray(value), option=orjson.OPT_SERIALIZE_NUMPY)
+    )
+
+
+# Path arrays held as float32 NumPy arrays: coerced on validation,
+# converted to lists only when dumped to JSON, and documented in the JSON
+# schema (and so in OpenAPI) as the nested float lists they become
+Float32Vector = Annotated[
+    Any,
+    BeforeValidator(_as_float32),
+    PlainSerializer(_float32_to_list, when_used='json'),
+    WithJsonSchema({'type': 'array', 'items': {'type': 'number'}}),
+]
+Float32Matrix = Annotated[
+    Any,
+    BeforeValidator(_as_float32),
+    PlainSerializer(_float32_to_list, when_used='json'),
+    WithJsonSchema({'type': 'array', 'items': {'type': 'array', 'items': {'type': 'number'}}}),
+]
 
 
 class RecommendationType(str, Enum):
@@ -51,7 +91,12 @@ class SummaryStatistics(BaseModel):
 
 
 class PathPercentile(BaseModel):
-    """Equity curve percentiles at a single time point."""
+    """
+    Equity curve percentiles at a single time point.
+    
+    Display-only: the bands are never used in further numerical work
+    server-side, so float32 precision is sufficient for them.
+    """
     month: int
     p5: float
     p25: float
@@ -66,13 +111,18 @@ class PathData(BaseModel):
     
     Contains percentile bands for visualization and optionally
     sample paths for the fan chart.
+    
+    ``sample_paths`` and ``median_path`` are held as float32 NumPy
+    arrays rather than lists: they are visualization data where a few
+    significant digits suffice, constructing the model does not validate
+    every float, and they are converted to lists only when dumped to JSON.
     """
     percentiles: List[PathPercentile]
-    sample_paths: Optional[List[List[float]]] = Field(
+    sample_paths: Optional[Float32Matrix] = Field(
         None, 
         description="Sampled individual paths for fan visualization"
     )
-    median_path: List[float]
+    median_path: Float32Vector
 
 
 class OutcomeDistribution(BaseModel):
@@ -25,7 +25,7 @@ Usage
 >>> path = customers.simulate_path(initial_state=10, n_steps=36, rng=rng)
 """
 
-from .base import BaseProcess
+from .base import BaseProcess, partition_paths
 from .poisson import PoissonProcess, CompoundPoissonProcess
 from .gbm import GeometricBrownianMotion
 from .jump_diffusion import JumpDiffusionProcess
@@ -38,6 +38,7 @@ from .regime import (
 
 __all__ = [
     'BaseProcess',
+    'partition_paths',
     'PoissonProcess',
     'CompoundPoissonProcess',
     'GeometricBrownianMotion',
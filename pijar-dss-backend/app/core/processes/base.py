@@ -20,19 +20,67 @@ Process Types in This Module:
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, List, Any
+from typing import Optional, List, Any, Sequence, Tuple, Union
 import numpy as np
 from numpy.random import Generator
 from numpy.typing import NDArray
 
 
+def partition_paths(
+    n_paths: int,
+    rng: Union[Generator, Sequence[Generator]],
+    n_workers: Optional[int] = None
+) -> List[Tuple[slice, Generator]]:
+    """
+    Split path indices into contiguous blocks, each with its own RNG stream.
+    
+    This is the standard entry point for parallel path simulation: each
+    block can be handed to a separate worker without sharing (or locking)
+    a single BitGenerator.
+    
+    Parameters
+    ----------
+    n_paths : int
+        Total number of paths
+    rng : Generator or sequence of Generator
+        Either a single generator, or precomputed independent child
+        generators (one per block)
+    n_workers : int, optional
+        With a single generator, spawn this many child streams via
+        ``Generator.spawn``. If omitted, all paths form one block drawn
+        from ``rng`` directly.
+        
+    Returns
+    -------
+    List[Tuple[slice, Generator]]
+        (row slice, generator) pairs covering all paths in order
+    """
+    if isinstance(rng, Generator):
+        if not n_workers or n_workers <= 1:
+            return [(slice(0, n_paths), rng)]
+        streams = rng.spawn(n_workers)
+    else:
+        streams = list(rng)
+    
+    bounds = np.linspace(0, n_paths, len(streams) + 1).astype(int)
+    return [
+        (slice(bounds[i], bounds[i + 1]), stream)
+        for i, stream in enumerate(streams)
+    ]
+
+
 class BaseProcess(ABC):
     """
     Abstract base class for stochastic processes.
     
     All time evolution models must inherit from this class.
+    
+    Declares empty ``__slots__`` so that subclasses which define their
+    own slots do not get a per-instance ``__dict__``.
     """
     
+    __slots__ = ()
+    
     @abstractmethod
     def step(
         self, 
@@ -68,6 +116,7 @@ class BaseProcess(ABC):
         initial_state: float, 
         n_steps: int, 
         rng: Generator,
+        out: Optional[NDArray] = None,
         **context
     ) -> NDArray:
         """
@@ -81,6 +130,9 @@ class BaseProcess(ABC):
             Number of time steps to simulate
         rng : Generator
             Random number generator
+        out : NDArray, optional
+            Preallocated buffer to write the path into. Lets callers
+            that simulate many paths allocate once and reuse the buffer.
         **context : dict
             Additional context
             
@@ -88,6 +140,7 @@ class BaseProcess(ABC):
         -------
         NDArray
             Array of shape (n_steps + 1,) with full path
+            (``out`` itself when provided)
         """
         pass
     
@@ -34,9 +34,16 @@ Use Cases in Pijar DSS:
 import numpy as np
 from numpy.random import Generator
 from numpy.typing import NDArray
-from typing import Optional, Callable
+from typing import Optional, Callable, Sequence, Union
 
-from .base import BaseProcess
+from .base import BaseProcess, partition_paths
+from ...utils.jit import vectorize
+
+
+@vectorize(['float64(float64, float64, float64)'])
+def _growth_factor(z, drift_term, vol_term):
+    """One-step GBM growth factor exp(drift_term + vol_term·z)."""
+    return np.exp(drift_term + vol_term * z)
 
 
 class GeometricBrownianMotion(BaseProcess):
@@ -65,6 +72,8 @@ class GeometricBrownianMotion(BaseProcess):
     18.5  # Approximately 10 × exp(0.03 × 24) with noise
     """
     
+    __slots__ = ('drift', 'volatility', 'dt', '_drift_term', '_vol_term')
+    
     def __init__(
         self, 
         drift: float, 
@@ -102,39 +111,87 @@ class GeometricBrownianMotion(BaseProcess):
         # Sample standard normal
         z = rng.standard_normal()
         
-        # Compute log-return
-        log_return = self._drift_term + self._vol_term * z
-        
-        # Apply multiplicatively
-        return current_state * np.exp(log_return)
+        # Apply the log-return multiplicatively
+        return current_state * _growth_factor(z, self._drift_term, self._vol_term)
     
     def simulate_path(
         self, 
         initial_state: float, 
         n_steps: int, 
         rng: Generator,
+        out: Optional[NDArray] = None,
         **context
     ) -> NDArray:
         """
         Generate a complete GBM path.
         
         Vectorized for efficiency: generates all random draws at once.
+        If ``out`` is given, the path is written into it instead of a
+        freshly allocated array.
         """
+        if out is None:
+            out = np.empty(n_steps + 1)
+        
         if initial_state <= 0:
-            return np.zeros(n_steps + 1)
+            out[:] = 0.0
+            return out
+        
+        drift_term = self._drift_term
+        vol_term = self._vol_term
         
         # Generate all random innovations at once
         z = rng.standard_normal(n_steps)
         
         # Compute log-returns
-        log_returns = self._drift_term + self._vol_term * z
+        log_returns = drift_term + vol_term * z
+        
+        # Cumulative sum in log space, then exponentiate - all in place
+        out[0] = 0.0
+        np.cumsum(log_returns, out=out[1:])
+        np.exp(out, out=out)
+        out *= initial_state
+        
+        return out
+    
+    def simulate_paths(
+        self,
+        initial_state: float,
+        n_paths: int,
+        n_steps: int,
+        rng: Union[Generator, Sequence[Generator]],
+        n_workers: Optional[int] = None,
+        **context
+    ) -> NDArray:
+        """
+        Generate many independent GBM paths at once.
+        
+        ``rng`` may be a single generator or a list of independent child
+        generators (see ``partition_paths``); each block of paths is drawn
+        from its own stream so blocks can run in parallel.
+        
+        Returns
+        -------
+        NDArray
+            Array of shape (n_paths, n_steps + 1)
+        """
+        paths = np.empty((n_paths, n_steps + 1))
+        paths[:, 0] = initial_state
+        
+        if initial_state <= 0:
+            paths[:, 1:] = 0.0
+            return paths
         
-        # Cumulative sum in log space, then exponentiate
-        cumulative_log_returns = np.concatenate([[0], np.cumsum(log_returns)])
+        drift_term = self._drift_term
+        vol_term = self._vol_term
         
-        path = initial_state * np.exp(cumulative_log_returns)
+        for rows, block_rng in partition_paths(n_paths, rng, n_workers):
+            block = paths[rows, 1:]
+            z = block_rng.standard_normal(block.shape)
+            np.cumsum(drift_term + vol_term * z, axis=1, out=block)
+            np.exp(block, out=block)
+            block *= initial_state
         
-        return path
+        return paths
     
     def expected_value(self, initial_state: float, t: float) -> float:
         """
@@ -34,11 +34,18 @@ Use Cases in Pijar DSS:
 import numpy as np
 from numpy.random import Generator
 from numpy.typing import NDArray
-from typing import Optional, Callable, Tuple
+from typing import Optional, Callable, Tuple, Sequence, Union
 
-from .base import BaseProcess
-from .gbm import GeometricBrownianMotion
+from .base import BaseProcess, partition_paths
+from .gbm import GeometricBrownianMotion, _growth_factor
 from .poisson import PoissonProcess
+from ...utils.jit import vectorize
+
+
+@vectorize(['float64(float64, float64, float64)'])
+def _jump_factor(z, mu, sigma):
+    """Multiplicative jump factor exp(μ + σz) for standard normal z."""
+    return np.exp(mu + sigma * z)
 
 
 class JumpDiffusionProcess(BaseProcess):
@@ -73,6 +80,11 @@ class JumpDiffusionProcess(BaseProcess):
     ... )
     """
     
+    __slots__ = (
+        'drift', 'volatility', 'jump_intensity', 'jump_mean', 'jump_std',
+        'dt', '_gbm', '_jump_process'
+    )
+    
     def __init__(
         self,
         drift: float,
@@ -111,8 +123,7 @@ class JumpDiffusionProcess(BaseProcess):
         
         Returns multiplicative factor: new_value = old_value × factor
         """
-        log_jump = rng.normal(self.jump_mean, self.jump_std)
-        return np.exp(log_jump)
+        return _jump_factor(rng.standard_normal(), self.jump_mean, self.jump_std)
     
     def step(
         self, 
@@ -134,32 +145,140 @@ class JumpDiffusionProcess(BaseProcess):
         n_jumps = self._jump_process.sample_count(rng, t, current_state, context)
         
         # 3. Apply jumps multiplicatively
-        for _ in range(n_jumps):
-            jump_factor = self._sample_jump_size(rng)
-            new_state *= jump_factor
+        # Diffusion and jump factors are both exp(.) > 0, so a positive
+        # state stays positive; no clamp is needed.
+        if n_jumps > 0:
+            z = rng.standard_normal(n_jumps)
+            new_state *= _jump_factor(z, self.jump_mean, self.jump_std).prod()
         
-        return max(0, new_state)
+        return new_state
     
     def simulate_path(
         self, 
         initial_state: float, 
         n_steps: int, 
         rng: Generator,
+        out: Optional[NDArray] = None,
         **context
     ) -> NDArray:
         """
         Generate a complete path with potential jumps.
         """
-        path = np.zeros(n_steps + 1)
+        path = np.empty(n_steps + 1) if out is None else out
         path[0] = initial_state
         
+        # Bound once: attribute lookups are slower than locals in the loop
+        step = self.step
+        
         current = initial_state
         for t in range(n_steps):
-            current = self.step(current, t, rng, **context)
+            current = step(current, t, rng, **context)
             path[t + 1] = current
         
         return path
     
+    def simulate_paths(
+        self,
+        initial_state: float,
+        n_paths: int,
+        n_steps: int,
+        rng: Union[Generator, Sequence[Generator]],
+        n_workers: Optional[int] = None,
+        **context
+    ) -> NDArray:
+        """
+        Generate many independent paths at once.
+        
+        ``rng`` may be a single generator or a list of independent child
+        generators; see ``partition_paths``. Each block of paths is drawn
+        from its own stream, so blocks can be simulated in parallel and
+        results stay reproducible for a given stream layout.
+        
+        Diffusion innovations and jump counts are drawn as whole
+        (n_paths, n_steps) matrices. The sum of k log-normal jump sizes
+        in one step is exactly Normal(k·μ_J, k·σ_J²) in log space, so
+        jumps are applied with one extra normal draw per cell rather than
+        one per jump. If the jump process has a state-dependent intensity
+        (a custom rate modifier), counts fall back to per-step sampling.
+        
+        Non-positive starting values are handled once up front; from a
+        positive start every step multiplies by exp(.), so the paths are
+        never clamped.
+        
+        Returns
+        -------
+        NDArray
+            Array of shape (n_paths, n_steps + 1)
+        """
+        paths = np.empty((n_paths, n_steps + 1))
+        paths[:, 0] = initial_state
+        
+        if initial_state <= 0:
+            paths[:, 1:] = 0.0
+            return paths
+        
+        for rows, block_rng in partition_paths(n_paths, rng, n_workers):
+            self._simulate_block(initial_state, paths[rows], block_rng, context)
+        
+        return paths
+    
+    def _simulate_block(
+        self,
+        initial_state: float,
+        paths: NDArray,
+        rng: Generator,
+        context: dict
+    ) -> None:
+        """Fill a (n, n_steps + 1) block of paths from a single stream."""
+        n_paths, n_steps = paths.shape[0], paths.shape[1] - 1
+        
+        z = rng.standard_normal((n_paths, n_steps))
+        log_returns = self._gbm._drift_term + self._gbm._vol_term * z
+        
+        if self._jump_process.has_constant_rate:
+            n_jumps = rng.poisson(self._jump_process.base_rate, size=(n_paths, n_steps))
+            jumped = n_jumps > 0
+            if jumped.any():
+                k = n_jumps[jumped]
+                log_returns[jumped] += (
+                    k * self.jump_mean
+                    + np.sqrt(k) * self.jump_std * rng.standard_normal(k.size)
+                )
+        else:
+            self._add_state_dependent_jumps(initial_state, log_returns, rng, context)
+        
+        np.cumsum(log_returns, axis=1, out=paths[:, 1:])
+        np.exp(paths[:, 1:], out=paths[:, 1:])
+        paths[:, 1:] *= initial_state
+    
+    def _add_state_dependent_jumps(
+        self,
+        initial_state: float,
+        log_returns: NDArray,
+        rng: Generator,
+        context: dict
+    ) -> None:
+        """
+        Fold jumps into ``log_returns`` step by step.
+        
+        Used when the jump intensity depends on the current state: each
+        count must see the path value before that step, so the draws
+        cannot be made up front.
+        """
+        n_paths, n_steps = log_returns.shape
+        current = np.full(n_paths, float(initial_state))
+        
+        for t in range(n_steps):
+            k = np.array([
+                self._jump_process.sample_count(rng, t, state, context)
+                for state in current
+            ])
+            log_returns[:, t] += (
+                k * self.jump_mean
+                + np.sqrt(k) * self.jump_std * rng.standard_normal(n_paths)
+            )
+            current *= np.exp(log_returns[:, t])
+    
     def decompose_path(
         self, 
         initial_state: float, 
@@ -184,26 +303,39 @@ class JumpDiffusionProcess(BaseProcess):
         path[0] = initial_state
         diffusion_path[0] = initial_state
         
+        # A non-positive start stays at zero, as in step and simulate_paths
+        if initial_state <= 0:
+            return path, diffusion_path, np.array(jump_times)
+        
         current = initial_state
         current_diffusion = initial_state
         
+        # Bind loop invariants to locals
+        drift_term = self._gbm._drift_term
+        vol_term = self._gbm._vol_term
+        jump_mean = self.jump_mean
+        jump_std = self.jump_std
+        sample_count = self._jump_process.sample_count
+        standard_normal = rng.standard_normal
+        
         for t in range(n_steps):
             # Diffusion component
-            z = rng.standard_normal()
-            log_return = self._gbm._drift_term + self._gbm._vol_term * z
+            z = standard_normal()
+            growth = _growth_factor(z, drift_term, vol_term)
             
-            current_diffusion *= np.exp(log_return)
+            current_diffusion *= growth
             diffusion_path[t + 1] = current_diffusion
             
             # Full path with jumps
-            current *= np.exp(log_return)
+            current *= growth
             
-            n_jumps = self._jump_process.sample_count(rng, t, current, {})
-            for _ in range(n_jumps):
-                jump_times.append(t)
-                current *= self._sample_jump_size(rng)
+            n_jumps = sample_count(rng, t, current, {})
+            if n_jumps > 0:
+                jump_times.extend([t] * n_jumps)
+                z_jumps = standard_normal(n_jumps)
+                current *= _jump_factor(z_jumps, jump_mean, jump_std).prod()
             
-            path[t + 1] = max(0, current)
+            path[t + 1] = current
         
         return path, diffusion_path, np.array(jump_times)
     
@@ -33,9 +33,49 @@ Use Cases in Pijar DSS:
 import numpy as np
 from numpy.random import Generator
 from numpy.typing import NDArray
-from typing import Optional, Callable, Union
+from typing import Optional, Callable, Union, TYPE_CHECKING
 
 from .base import BaseProcess
+from ...utils.jit import njit
+
+if TYPE_CHECKING:
+    from ..distributions import BaseDistribution
+
+
+def _unit_rate_modifier(t: int, state: float, context: dict) -> float:
+    """Default rate modifier: the rate is constant at base_rate."""
+    return 1.0
+
+
+# Above this rate Knuth's method needs too many uniforms per draw
+_KNUTH_MAX_RATE = 30.0
+
+
+@njit(cache=True)
+def _fast_poisson(rng: Generator, lam: float) -> int:
+    """
+    Draw one Poisson(λ) variate, specialized for small λ.
+    
+    Uses Knuth's multiplication method: multiply uniforms until the
+    product drops below e^(-λ). That costs about λ + 1 uniforms, which
+    inside a compiled loop is cheaper than the general sampler for the
+    small rates used here (a few leads per month). Rates of
+    ``_KNUTH_MAX_RATE`` and above fall through to ``rng.poisson``.
+    
+    Intended for use inside ``njit`` kernels. A single call from Python
+    pays the kernel dispatch cost, so Python code should keep using
+    ``rng.poisson``.
+    """
+    if lam >= _KNUTH_MAX_RATE:
+        return rng.poisson(lam)
+    
+    limit = np.exp(-lam)
+    k = 0
+    p = rng.random()
+    while p > limit:
+        k += 1
+        p *= rng.random()
+    return k
 
 
 class PoissonProcess(BaseProcess):
@@ -72,7 +112,25 @@ class PoissonProcess(BaseProcess):
             raise ValueError(f"base_rate must be >= 0, got {base_rate}")
         
         self.base_rate = base_rate
-        self.rate_modifier = rate_modifier or (lambda t, s, c: 1.0)
+        self.rate_modifier = rate_modifier or _unit_rate_modifier
+    
+    @property
+    def has_constant_rate(self) -> bool:
+        """
+        Whether the arrival rate is base_rate at every step.
+        
+        When True, ``sample_count`` is equivalent to ``rng.poisson(base_rate)``
+        regardless of time, state or context, so callers may draw many
+        counts in a single vectorized ``rng.poisson(base_rate, size=...)``.
+        Subclasses that override the rate or sampling logic are never
+        considered constant.
+        """
+        cls = type(self)
+        return (
+            self.rate_modifier is _unit_rate_modifier
+            and cls.get_effective_rate is PoissonProcess.get_effective_rate
+            and cls.sample_count is PoissonProcess.sample_count
+        )
     
     def get_effective_rate(
         self, 
@@ -154,21 +212,73 @@ class PoissonProcess(BaseProcess):
         initial_state: float, 
         n_steps: int, 
         rng: Generator,
+        out: Optional[NDArray] = None,
         **context
     ) -> NDArray:
         """
         Generate a path of event counts.
         
+        The whole path is drawn with a single ``rng.poisson`` call. The
+        state passed to the rate modifier is ``initial_state`` at every
+        step, so per-step rates depend on ``t`` only and can be computed
+        up front. Subclasses that override ``sample_count`` keep the
+        per-step loop.
+        
         Returns
         -------
         NDArray
             Array of shape (n_steps,) with event count at each step
         """
-        counts = np.zeros(n_steps, dtype=np.int64)
+        counts = np.empty(n_steps, dtype=np.int64) if out is None else out
+        
+        if self.has_constant_rate:
+            counts[:] = rng.poisson(self.base_rate, size=n_steps)
+        elif type(self).sample_count is PoissonProcess.sample_count:
+            rates = np.array([
+                self.get_effective_rate(t, initial_state, context)
+                for t in range(n_steps)
+            ])
+            counts[:] = rng.poisson(rates)
+        else:
+            for t in range(n_steps):
+                counts[t] = self.sample_count(rng, t, initial_state, context)
+        
+        return counts
+    
+    def simulate_batch(
+        self,
+        n_paths: int,
+        n_steps: int,
+        rng: Generator,
+        **context
+    ) -> NDArray:
+        """
+        Generate event counts for many independent paths in one draw.
+        
+        As in ``simulate_path``, rates depend on ``t`` only (the state is
+        fixed at 0), so a (n_steps,) rate vector broadcasts across paths
+        and the whole (n_paths, n_steps) matrix comes from a single
+        ``rng.poisson`` call. Subclasses that override ``sample_count``
+        fall back to one ``simulate_path`` per path.
+        
+        Returns
+        -------
+        NDArray
+            Array of shape (n_paths, n_steps) with event counts
+        """
+        if self.has_constant_rate:
+            return rng.poisson(self.base_rate, size=(n_paths, n_steps))
         
-        for t in range(n_steps):
-            counts[t] = self.sample_count(rng, t, initial_state, context)
+        if type(self).sample_count is PoissonProcess.sample_count:
+            rates = np.array([
+                self.get_effective_rate(t, 0, context)
+                for t in range(n_steps)
+            ])
+            return rng.poisson(rates, size=(n_paths, n_steps))
         
+        counts = np.empty((n_paths, n_steps), dtype=np.int64)
+        for i in range(n_paths):
+            self.simulate_path(0, n_steps, rng, out=counts[i], **context)
         return counts
     
     def simulate_cumulative_path(
@@ -180,14 +290,21 @@ class PoissonProcess(BaseProcess):
         """
         Generate cumulative count path (total events up to time t).
         
+        Counts are drawn straight into the output buffer (one
+        ``rng.poisson`` call for a constant rate) and accumulated in
+        place, with no intermediate arrays or Python stepping.
+        
         Returns
         -------
         NDArray
             Array of shape (n_steps + 1,) starting from 0
         """
-        counts = self.simulate_path(0, n_steps, rng, **context)
-        cumulative = np.zeros(n_steps + 1, dtype=np.int64)
-        cumulative[1:] = np.cumsum(counts)
+        cumulative = np.empty(n_steps + 1, dtype=np.int64)
+        cumulative[0] = 0
+        
+        counts = cumulative[1:]
+        self.simulate_path(0, n_steps, rng, out=counts, **context)
+        np.cumsum(counts, out=counts)
         
         return cumulative
     
@@ -210,16 +327,74 @@ class CompoundPoissonProcess(BaseProcess):
     arrival_rate : float
         Rate of the underlying Poisson process
     magnitude_sampler : callable
-        Function (rng) -> magnitude for each arrival
+        Function (rng, size) -> array of ``size`` magnitudes. Drawing all
+        arrivals of a step (or a path) in one call avoids a Python-level
+        call per arrival. Use ``from_distribution`` to wrap any
+        ``BaseDistribution``.
+    fast_mode : bool
+        Serve magnitudes from a pre-drawn pool instead of sampling on
+        every call. The pool is filled with ``pool_size`` draws at a
+        time and consumed sequentially, amortizing sampler overhead
+        across steps and paths. Valid because magnitudes do not depend
+        on state, but magnitudes are then shared across every caller of
+        this instance, so results are no longer reproducible per path.
+    pool_size : int
+        Number of magnitudes drawn per pool refill in fast mode
     """
     
     def __init__(
         self, 
         arrival_rate: float,
-        magnitude_sampler: Callable[[Generator], float]
+        magnitude_sampler: Callable[[Generator, int], NDArray],
+        fast_mode: bool = False,
+        pool_size: int = 1_000_000
     ):
+        if pool_size <= 0:
+            raise ValueError(f"pool_size must be positive, got {pool_size}")
+        
         self.arrival_process = PoissonProcess(base_rate=arrival_rate)
         self.magnitude_sampler = magnitude_sampler
+        self.fast_mode = fast_mode
+        self.pool_size = pool_size
+        
+        self._pool = np.empty(0)
+        self._pool_ptr = 0
+    
+    def _draw_magnitudes(self, rng: Generator, n: int) -> NDArray:
+        """Draw ``n`` magnitudes, from the pool in fast mode."""
+        if not self.fast_mode:
+            return self.magnitude_sampler(rng, n)
+        
+        start = self._pool_ptr
+        if start + n <= len(self._pool):
+            self._pool_ptr = start + n
+            return self._pool[start:start + n]
+        
+        # Keep the unused tail, then refill with at least n new draws
+        remainder = self._pool[start:]
+        fresh = self.magnitude_sampler(rng, max(self.pool_size, n - len(remainder)))
+        self._pool = np.concatenate([remainder, fresh])
+        self._pool_ptr = n
+        return self._pool[:n]
+    
+    @classmethod
+    def from_distribution(
+        cls,
+        arrival_rate: float,
+        distribution: "BaseDistribution",
+        **kwargs
+    ) -> "CompoundPoissonProcess":
+        """
+        Build from a distribution whose ``sample(size, rng)`` draws the
+        magnitudes (e.g. ``LogNormalDistribution``, ``GammaDistribution``).
+        Extra keyword arguments (``fast_mode``, ``pool_size``) are passed
+        to the constructor.
+        """
+        return cls(
+            arrival_rate,
+            lambda rng, size: distribution.sample(size=size, rng=rng),
+            **kwargs
+        )
     
     def step(
         self, 
@@ -236,24 +411,34 @@ class CompoundPoissonProcess(BaseProcess):
         if n_arrivals == 0:
             return 0.0
         
-        total = sum(self.magnitude_sampler(rng) for _ in range(n_arrivals))
-        return total
+        return float(self._draw_magnitudes(rng, n_arrivals).sum())
     
     def simulate_path(
         self, 
         initial_state: float, 
         n_steps: int, 
         rng: Generator,
+        out: Optional[NDArray] = None,
         **context
     ) -> NDArray:
-        """Generate path of aggregate magnitudes per period."""
-        path = np.zeros(n_steps + 1)
+        """
+        Generate path of aggregate magnitudes per period.
+        
+        Arrival counts for all steps are drawn first, then every
+        magnitude on the path in a single sampler call; per-step totals
+        are recovered with ``np.bincount``.
+        """
+        path = np.empty(n_steps + 1) if out is None else out
         path[0] = initial_state
         
-        cumulative = initial_state
-        for t in range(n_steps):
-            increment = self.step(cumulative, t, rng, **context)
-            cumulative += increment
-            path[t + 1] = cumulative
+        counts = self.arrival_process.simulate_path(
+            initial_state, n_steps, rng, **context
+        )
+        magnitudes = self._draw_magnitudes(rng, int(counts.sum()))
+        step_index = np.repeat(np.arange(n_steps), counts)
+        increments = np.bincount(step_index, weights=magnitudes, minlength=n_steps)
+        
+        np.cumsum(increments, out=path[1:])
+        path[1:] += initial_state
         
         return path
\ No newline at end of file
@@ -38,6 +38,10 @@ from numpy.typing import NDArray
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, field
 from enum import Enum
+from scipy import sparse as sp
+from scipy.sparse.linalg import eigs
+
+from ...utils.jit import njit
 
 
 class RegimeType(Enum):
@@ -73,6 +77,92 @@ class RegimeParameters:
             'cost_multiplier': self.cost_multiplier,
             'risk_intensity_multiplier': self.risk_intensity_multiplier,
         }
+    
+    def to_array(self) -> NDArray:
+        """Multipliers as a length-6 array in the ``R_*`` column order."""
+        return np.array([
+            self.lead_multiplier,
+            self.win_rate_multiplier,
+            self.churn_multiplier,
+            self.revenue_multiplier,
+            self.cost_multiplier,
+            self.risk_intensity_multiplier,
+        ])
+
+
+# Columns of RegimeSwitchingModel.params_matrix, in RegimeParameters order
+R_LEAD = 0
+R_WIN_RATE = 1
+R_CHURN = 2
+R_REVENUE = 3
+R_COST = 4
+R_RISK_INTENSITY = 5
+
+
+@njit(cache=True)
+def _sample_regime_indices(cdf: NDArray, u: NDArray, initial_idx: int) -> NDArray:
+    """
+    Walk the Markov chain given pre-drawn uniforms.
+    
+    ``cdf`` holds the row-wise cumulative transition probabilities;
+    step t moves to the first regime whose cumulative probability
+    exceeds ``u[t]``. Returns indices of length ``len(u) + 1``.
+    """
+    n_steps = u.shape[0]
+    path = np.empty(n_steps + 1, dtype=np.int64)
+    path[0] = initial_idx
+    
+    current = initial_idx
+    for t in range(n_steps):
+        current = np.searchsorted(cdf[current], u[t], side='right')
+        path[t + 1] = current
+    
+    return path
+
+
+@njit(cache=True)
+def _sample_regime_indices_sparse(
+    indptr: NDArray,
+    cols: NDArray,
+    cdf: NDArray,
+    u: NDArray,
+    initial_idx: int
+) -> NDArray:
+    """
+    Sparse counterpart of ``_sample_regime_indices``.
+    
+    The chain is stored in CSR form: row i's reachable regimes are
+    ``cols[indptr[i]:indptr[i+1]]`` with cumulative probabilities in the
+    same slice of ``cdf``, so each step searches only the nonzeros.
+    """
+    n_steps = u.shape[0]
+    path = np.empty(n_steps + 1, dtype=np.int64)
+    path[0] = initial_idx
+    
+    current = initial_idx
+    for t in range(n_steps):
+        start, end = indptr[current], indptr[current + 1]
+        k = np.searchsorted(cdf[start:end], u[t], side='right')
+        current = cols[start + k]
+        path[t + 1] = current
+    
+    return path
+
+
+def _stationary_3x3(P: NDArray) -> NDArray:
+    """
+    Unnormalized stationary vector of a 3-state chain, in closed form.
+    
+    With A = I - P, π_i is proportional to the principal minor of A
+    obtained by deleting row and column i (the Markov chain tree
+    theorem). For K = 3 each minor is a 2×2 determinant.
+    """
+    a = np.eye(3) - P
+    return np.array([
+        a[1, 1] * a[2, 2] - a[1, 2] * a[2, 1],
+        a[0, 0] * a[2, 2] - a[0, 2] * a[2, 0],
+        a[0, 0] * a[1, 1] - a[0, 1] * a[1, 0],
+    ])
 
 
 # Default regime configurations
@@ -120,6 +210,11 @@ class RegimeSwitchingModel:
         Ordering of regimes corresponding to matrix indices
     initial_regime : RegimeType
         Starting regime
+    sparse : bool
+        Store transitions in CSR form. Sampling then searches only each
+        row's nonzero transitions, and the stationary distribution uses a
+        sparse eigensolver. Worth it for many regimes with few
+        transitions each; the dense default is faster for small K.
         
     Examples
     --------
@@ -144,6 +239,7 @@ class RegimeSwitchingModel:
         default_factory=lambda: [RegimeType.NORMAL, RegimeType.STRESS, RegimeType.BOOM]
     )
     initial_regime: RegimeType = RegimeType.NORMAL
+    sparse: bool = False
     
     def __post_init__(self):
         """Validate the transition matrix."""
@@ -156,7 +252,7 @@ class RegimeSwitchingModel:
             )
         
         # Check rows sum to 1
-        row_sums = self.transition_matrix.sum(axis=1)
+        row_sums = np.asarray(self.transition_matrix.sum(axis=1)).ravel()
         if not np.allclose(row_sums, 1.0):
             raise ValueError(
                 f"Transition matrix rows must sum to 1, got {row_sums}"
@@ -165,6 +261,51 @@ class RegimeSwitchingModel:
         # Build index lookups
         self._regime_to_idx = {r: i for i, r in enumerate(self.regime_order)}
         self._idx_to_regime = {i: r for i, r in enumerate(self.regime_order)}
+        
+        # Regime multipliers as a (K, 6) matrix: row k holds the k-th
+        # regime's multipliers in the R_* column order, so hot loops can
+        # index by integer regime id instead of going through dicts
+        self._params_matrix = np.array([
+            self.get_parameters(r).to_array() for r in self.regime_order
+        ])
+        
+        # Row-wise CDF for inverse-transform sampling. The last entry of
+        # each row is pinned to 1 so rounding in cumsum can never push a
+        # draw past the final reachable regime.
+        if self.sparse:
+            self._build_sparse_cdf()
+        else:
+            self._cdf = np.cumsum(self.transition_matrix, axis=1)
+            self._cdf[:, -1] = 1.0
+        
+        # The transition matrix is fixed for the model's lifetime
+        self._stationary = self._solve_stationary()
+    
+    def _build_sparse_cdf(self) -> None:
+        """Build CSR arrays of per-row nonzero columns and their CDFs."""
+        csr = sp.csr_matrix(self.transition_matrix)
+        csr.eliminate_zeros()
+        csr.sort_indices()
+        self._csr = csr
+        
+        self._indptr = csr.indptr.astype(np.int64)
+        self._cols = csr.indices.astype(np.int64)
+        self._sparse_cdf = np.empty(csr.nnz)
+        
+        self._row_cols = []
+        self._row_cdfs = []
+        for i in range(csr.shape[0]):
+            start, end = self._indptr[i], self._indptr[i + 1]
+            row_cdf = self._sparse_cdf[start:end]
+            np.cumsum(csr.data[start:end], out=row_cdf)
+            row_cdf[-1] = 1.0
+            self._row_cols.append(self._cols[start:end])
+            self._row_cdfs.append(row_cdf)
+    
+    @property
+    def params_matrix(self) -> NDArray:
+        """Regime multipliers, shape (K, 6); rows follow ``regime_order``."""
+        return self._params_matrix
     
     def get_regime_index(self, regime: RegimeType) -> int:
         """Get the matrix index for a regime."""
@@ -194,16 +335,40 @@ class RegimeSwitchingModel:
         RegimeType
             Sampled next regime
         """
-        current_idx = self.get_regime_index(current_regime)
-        probs = self.transition_matrix[current_idx]
-        
-        next_idx = rng.choice(len(probs), p=probs)
+        next_idx = self.sample_next_index(self.get_regime_index(current_regime), rng)
         return self.get_regime_from_index(next_idx)
     
+    def sample_next_index(self, current_idx: int, rng: Generator) -> int:
+        """
+        Sample the next regime index given the current one.
+        
+        Integer counterpart of ``sample_next_regime`` for loops that
+        carry the regime as a position in ``regime_order``.
+        """
+        if self.sparse:
+            cols = self._row_cols[current_idx]
+            k = np.searchsorted(self._row_cdfs[current_idx], rng.random(), side='right')
+            return int(cols[k])
+        
+        return int(np.searchsorted(self._cdf[current_idx], rng.random(), side='right'))
+    
     def get_parameters(self, regime: RegimeType) -> RegimeParameters:
         """Get the parameters for a specific regime."""
         return self.regime_params.get(regime, self.regime_params[RegimeType.NORMAL])
     
+    def monthly_churn_by_regime(self, annual_churn_rate: float) -> NDArray:
+        """
+        Monthly churn probability in each regime for a base annual rate.
+        
+        Entry k is 1 - (1 - min(0.99, rate × churn_multiplier_k))^(1/12)
+        for the k-th regime in ``regime_order``. Computing this once per
+        base rate turns the fractional power in the monthly loop into a
+        lookup by regime index.
+        """
+        churn_mults = self._params_matrix[:, R_CHURN]
+        effective_annual = np.minimum(0.99, annual_churn_rate * churn_mults)
+        return 1 - (1 - effective_annual) ** (1/12)
+    
     def simulate_regime_path(
         self, 
         n_steps: int, 
@@ -227,14 +392,35 @@ class RegimeSwitchingModel:
         List[RegimeType]
             Sequence of regimes, length n_steps + 1 (includes initial)
         """
-        current = initial or self.initial_regime
-        path = [current]
+        indices = self.simulate_regime_indices(n_steps, rng, initial)
+        idx_to_regime = self._idx_to_regime
+        return [idx_to_regime[i] for i in indices.tolist()]
+    
+    def simulate_regime_indices(
+        self,
+        n_steps: int,
+        rng: Generator,
+        initial: Optional[RegimeType] = None
+    ) -> NDArray:
+        """
+        Simulate a path of regime indices (positions in ``regime_order``).
         
-        for _ in range(n_steps):
-            current = self.sample_next_regime(current, rng)
-            path.append(current)
+        All uniforms are drawn in a single call and the chain is walked
+        by a compiled CDF lookup.
         
-        return path
+        Returns
+        -------
+        NDArray
+            Integer array of length n_steps + 1 (includes initial)
+        """
+        initial_idx = self.get_regime_index(initial or self.initial_regime)
+        u = rng.random(n_steps)
+        
+        if self.sparse:
+            return _sample_regime_indices_sparse(
+                self._indptr, self._cols, self._sparse_cdf, u, initial_idx
+            )
+        return _sample_regime_indices(self._cdf, u, initial_idx)
     
     def compute_stationary_distribution(self) -> Dict[RegimeType, float]:
         """
@@ -244,31 +430,50 @@ class RegimeSwitchingModel:
         where P is the transition matrix.
         
         This gives the expected fraction of time spent in each regime
-        over a long simulation.
+        over a long simulation. The result is computed once at
+        construction; this returns a copy of the cached mapping.
         
         Returns
         -------
         Dict[RegimeType, float]
             Mapping from regime to long-run probability
         """
-        # Solve π(P - I) = 0 subject to Σπ = 1
-        # Equivalent to finding left eigenvector with eigenvalue 1
-        n = len(self.regime_order)
+        return dict(self._stationary)
+    
+    def _solve_stationary(self) -> Dict[RegimeType, float]:
+        """
+        Solve for the stationary distribution.
         
-        # Add constraint that probabilities sum to 1
-        A = np.vstack([
-            self.transition_matrix.T - np.eye(n),
-            np.ones(n)
-        ])
-        b = np.zeros(n + 1)
-        b[-1] = 1
+        π is the left eigenvector of P for eigenvalue 1, i.e. the right
+        eigenvector of Pᵀ whose eigenvalue is closest to 1, normalized
+        to sum to 1. The common 3-regime chain uses the closed-form
+        cofactor solution instead; it falls back to the eigensolver when
+        the minors vanish (a chain without a unique stationary law).
+        """
+        if len(self.regime_order) == 3:
+            P = self._csr.toarray() if self.sparse else np.asarray(self.transition_matrix)
+            pi = _stationary_3x3(P)
+            total = pi.sum()
+            if total > 1e-12:
+                pi = np.maximum(pi / total, 0)
+                pi = pi / pi.sum()
+                return {regime: float(pi[i]) for i, regime in enumerate(self.regime_order)}
+        
+        # The sparse eigensolver needs k < K - 1, i.e. K >= 3
+        if self.sparse and self._csr.shape[0] >= 3:
+            eigenvalues, eigenvectors = eigs(self._csr.T.astype(np.float64), k=1, which='LR')
+        else:
+            eigenvalues, eigenvectors = np.linalg.eig(
+                self._csr.T.toarray() if self.sparse else self.transition_matrix.T
+            )
+        idx = np.argmin(np.abs(eigenvalues - 1.0))
         
-        # Least squares solution
-        pi, _, _, _ = np.linalg.lstsq(A, b, rcond=None)
-        pi = np.maximum(pi, 0)  # Ensure non-negative
-        pi = pi / pi.sum()  # Normalize
+        pi = np.real(eigenvectors[:, idx])
+        pi = pi / pi.sum()  # Normalize (also fixes the eigenvector's sign)
+        pi = np.maximum(pi, 0)  # Clip round-off negatives
+        pi = pi / pi.sum()
         
-        return {regime: pi[i] for i, regime in enumerate(self.regime_order)}
+        return {regime: float(pi[i]) for i, regime in enumerate(self.regime_order)}
     
     @classmethod
     def create_default(
@@ -325,6 +530,5 @@ class RegimeSwitchingModel:
         )
     
     def __repr__(self) -> str:
-        stationary = self.compute_stationary_distribution()
-        probs_str = ", ".join(f"{r.value}={p:.1%}" for r, p in stationary.items())
+        probs_str = ", ".join(f"{r.value}={p:.1%}" for r, p in self._stationary.items())
         return f"RegimeSwitchingModel(stationary=[{probs_str}])"
\ No newline at end of file
@@ -4,20 +4,37 @@ Simulation Module.
 Provides the Monte Carlo simulation engine and supporting components.
 """
 
-from .business_model import BusinessModel, BusinessState, PipelineDeal
-from .risk_events import RiskEventManager, RiskEventConfig, ActiveShock
-from .path import PathSimulator, PathResult
+from .business_model import (
+    BusinessModel,
+    BusinessState,
+    PipelineDeal,
+    PipelineArrays,
+    apply_churn_batch,
+    monthly_churn_probability,
+)
+from .risk_events import (
+    RiskEventManager,
+    BatchedRiskEventManager,
+    RiskEventConfig,
+    ActiveShock,
+)
+from .path import PathSimulator, PathResult, PathResultsBatch
 from .engine import SimulationEngine, SampledParameters, create_distribution
 
 __all__ = [
     'BusinessModel',
     'BusinessState',
     'PipelineDeal',
+    'PipelineArrays',
+    'apply_churn_batch',
+    'monthly_churn_probability',
     'RiskEventManager',
+    'BatchedRiskEventManager',
     'RiskEventConfig',
     'ActiveShock',
     'PathSimulator',
     'PathResult',
+    'PathResultsBatch',
     'SimulationEngine',
     'SampledParameters',
     'create_distribution',
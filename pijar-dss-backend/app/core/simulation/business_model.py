@@ -30,7 +30,7 @@ import numpy as np
 from numpy.random import Generator
 from numpy.typing import NDArray
 from dataclasses import dataclass, field
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 
 from ..distributions import (
     TriangularDistribution,
@@ -39,9 +39,64 @@ from ..distributions import (
     GammaDistribution,
 )
 from ..processes import PoissonProcess
+from . import kernels
+from ...utils.jit import typed_list
 
 
-@dataclass
+def monthly_churn_probability(
+    annual_rate: Union[float, NDArray],
+    churn_mult: Union[float, NDArray] = 1.0
+) -> Union[float, NDArray]:
+    """
+    Convert annual churn rates to monthly churn probabilities.
+    
+    P(churn in month) = 1 - (1 - min(0.99, annual_rate × mult))^(1/12)
+    
+    Works elementwise on arrays, so a table of probabilities (e.g. one
+    per regime) can be built once and looked up in the monthly loop.
+    """
+    effective_annual = np.minimum(0.99, np.multiply(annual_rate, churn_mult))
+    return 1 - (1 - effective_annual) ** (1/12)
+
+
+def apply_churn_batch(
+    customers: NDArray,
+    annual_rate: Union[float, NDArray],
+    churn_mult: Union[float, NDArray],
+    rng: Generator
+) -> Tuple[NDArray, NDArray]:
+    """
+    Apply one month of churn to many customer bases at once.
+    
+    Converts annual churn rates to monthly probabilities,
+    P(churn in month) = 1 - (1 - annual_rate × mult)^(1/12), with the
+    effective annual rate capped at 0.99, and draws every path's churn
+    count in a single ``rng.binomial`` call.
+    
+    Parameters
+    ----------
+    customers : NDArray
+        Current customer count per path
+    annual_rate : float or NDArray
+        Annual churn rate (scalar or per path)
+    churn_mult : float or NDArray
+        Churn multiplier (scalar or per path)
+    rng : Generator
+        Random number generator
+        
+    Returns
+    -------
+    tuple
+        (remaining_customers, churned)
+    """
+    monthly_probs = monthly_churn_probability(annual_rate, churn_mult)
+    churned = rng.binomial(customers, monthly_probs)
+    remaining = np.maximum(0, np.subtract(customers, churned))
+    
+    return remaining, churned
+
+
+@dataclass(slots=True, frozen=True)
 class PipelineDeal:
     """
     A deal in the sales pipeline.
@@ -66,16 +121,107 @@ class PipelineDeal:
     is_bumn: bool
 
 
-@dataclass
+@dataclass(slots=True)
+class PipelineArrays:
+    """
+    Sales pipeline stored as parallel arrays (structure of arrays).
+    
+    Each index across the arrays is one deal, with the same fields as
+    ``PipelineDeal``. Only the first ``length`` slots are live; the
+    arrays are preallocated and grown geometrically, so appending a
+    month of leads does not allocate per deal and closings are a
+    vectorized mask rather than a scan over Python objects.
+    """
+    entry_month: NDArray
+    close_month: NDArray
+    will_convert: NDArray
+    contract_value: NDArray
+    is_bumn: NDArray
+    length: int = 0
+    
+    _FIELDS = ('entry_month', 'close_month', 'will_convert', 'contract_value', 'is_bumn')
+    
+    @classmethod
+    def empty(cls, capacity: int = 1024) -> 'PipelineArrays':
+        """Create an empty pipeline with room for ``capacity`` deals."""
+        return cls(
+            entry_month=np.empty(capacity, dtype=np.int32),
+            close_month=np.empty(capacity, dtype=np.int32),
+            will_convert=np.empty(capacity, dtype=np.bool_),
+            contract_value=np.empty(capacity, dtype=np.float64),
+            is_bumn=np.empty(capacity, dtype=np.bool_),
+        )
+    
+    def __len__(self) -> int:
+        return self.length
+    
+    @property
+    def capacity(self) -> int:
+        return self.close_month.shape[0]
+    
+    def append(
+        self,
+        entry_month: int,
+        close_month: NDArray,
+        will_convert: NDArray,
+        contract_value: NDArray,
+        is_bumn: NDArray
+    ) -> None:
+        """Append a batch of deals that entered in ``entry_month``."""
+        n = len(close_month)
+        start, end = self.length, self.length + n
+        self.reserve(n)
+        
+        self.entry_month[start:end] = entry_month
+        self.close_month[start:end] = close_month
+        self.will_convert[start:end] = will_convert
+        self.contract_value[start:end] = contract_value
+        self.is_bumn[start:end] = is_bumn
+        self.length = end
+    
+    def reserve(self, n: int) -> None:
+        """Ensure room for ``n`` more deals, growing geometrically."""
+        needed = self.length + n
+        if needed > self.capacity:
+            new_capacity = max(needed, 2 * self.capacity)
+            for name in self._FIELDS:
+                setattr(self, name, np.resize(getattr(self, name), new_capacity))
+    
+    def compact(self, keep: NDArray) -> None:
+        """Keep only the live deals selected by boolean mask ``keep``."""
+        n_keep = int(keep.sum())
+        for name in self._FIELDS:
+            arr = getattr(self, name)
+            arr[:n_keep] = np.compress(keep, arr[:self.length])
+        self.length = n_keep
+    
+    def deals(self) -> List[PipelineDeal]:
+        """Materialize the live deals as ``PipelineDeal`` records."""
+        n = self.length
+        return [
+            PipelineDeal(*row)
+            for row in zip(
+                self.entry_month[:n].tolist(),
+                self.close_month[:n].tolist(),
+                self.will_convert[:n].tolist(),
+                self.contract_value[:n].tolist(),
+                self.is_bumn[:n].tolist()
+            )
+        ]
+
+
+@dataclass(slots=True)
 class BusinessState:
     """
     Current state of the business.
     
-    Tracks all state variables that evolve over time.
+    Tracks all state variables that evolve over time. The per-month
+    series of a path are written into preallocated arrays by
+    ``BusinessModel.simulate_path``.
     """
     capital: float
     customers: int
-    pipeline: List[PipelineDeal] = field(default_factory=list)
+    pipeline: PipelineArrays = field(default_factory=PipelineArrays.empty)
     
     # Tracking metrics
     cumulative_revenue: float = 0.0
@@ -84,13 +230,6 @@ class BusinessState:
     max_drawdown: float = 0.0
     breakeven_month: int = -1
     
-    # Monthly metrics (for analysis)
-    monthly_revenues: List[float] = field(default_factory=list)
-    monthly_costs: List[float] = field(default_factory=list)
-    monthly_customers: List[int] = field(default_factory=list)
-    monthly_new_customers: List[int] = field(default_factory=list)
-    monthly_churned: List[int] = field(default_factory=list)
-    
     def update_drawdown(self):
         """Update peak and drawdown tracking."""
         if self.capital > self.peak_capital:
@@ -140,6 +279,31 @@ class BusinessModel:
         self.size_probs = {k: v/total for k, v in size_weights.items()}
         self.sizes = list(self.size_probs.keys())
         self.probs = list(self.size_probs.values())
+        
+        # Size CDF for inverse-transform sampling (last entry pinned to 1
+        # so a uniform draw can never fall past the final size)
+        self._probs_arr = np.asarray(self.probs)
+        self._size_cdf = np.cumsum(self._probs_arr)
+        self._size_cdf[-1] = 1.0
+        
+        # Flat parameter arrays for the compiled monthly kernel. Only
+        # lognormal contract values with a gamma sales cycle are
+        # supported there; other distributions use the Python methods.
+        self._use_kernel = (
+            isinstance(sales_cycle_dist, GammaDistribution)
+            and all(
+                isinstance(contract_distributions[size], LogNormalDistribution)
+                for size in self.sizes
+            )
+        )
+        if self._use_kernel:
+            self._contract_mu = np.array(
+                [contract_distributions[size].mu for size in self.sizes]
+            )
+            self._contract_sigma = np.array(
+                [contract_distributions[size].sigma for size in self.sizes]
+            )
+            self._avg_contract = self.compute_avg_contract_value()
     
     def sample_contract_value(self, rng: Generator) -> Tuple[str, float]:
         """
@@ -151,7 +315,8 @@ class BusinessModel:
             (size_category, annual_contract_value)
         """
         # Sample size category
-        size = rng.choice(self.sizes, p=self.probs)
+        idx = int(np.searchsorted(self._size_cdf, rng.random(), side='right'))
+        size = self.sizes[idx]
         
         # Sample value from corresponding distribution
         value = self.contract_distributions[size].sample(rng=rng)[0]
@@ -201,35 +366,323 @@ class BusinessModel:
         int
             Number of leads added to pipeline
         """
+        if n_leads == 0:
+            return 0
+        
         regime_multipliers = regime_multipliers or {}
         win_mult = regime_multipliers.get('win_rate_multiplier', 1.0)
         
-        for _ in range(n_leads):
-            # Determine if BUMN or open market
-            is_bumn = rng.random() < bumn_ratio
+        # Draw every lead attribute as one array per attribute
+        # Determine if BUMN or open market
+        is_bumn = rng.random(n_leads) < bumn_ratio
+        
+        # Get effective win rate and determine if will convert
+        base_wins = np.where(is_bumn, win_rate_bumn, win_rate_open)
+        effective_wins = np.minimum(1.0, base_wins * win_mult)
+        will_convert = rng.random(n_leads) < effective_wins
+        
+        # Sample contract values, grouped by size category
+        size_idx = np.searchsorted(self._size_cdf, rng.random(n_leads), side='right')
+        contract_values = np.empty(n_leads)
+        for i, size in enumerate(self.sizes):
+            in_size = size_idx == i
+            count = int(in_size.sum())
+            if count:
+                contract_values[in_size] = self.contract_distributions[size].sample(
+                    size=count, rng=rng
+                )
+        
+        # Sample sales cycles
+        cycles = self.sales_cycle_dist.sample(size=n_leads, rng=rng)
+        close_months = month + np.maximum(1, np.round(cycles).astype(np.int64))
+        
+        state.pipeline.append(
+            entry_month=month,
+            close_month=close_months,
+            will_convert=will_convert,
+            contract_value=contract_values,
+            is_bumn=is_bumn
+        )
+        
+        return n_leads
+    
+    def step_month(
+        self,
+        state: BusinessState,
+        month: int,
+        n_leads: int,
+        win_rate_bumn: float,
+        win_rate_open: float,
+        bumn_ratio: float,
+        annual_churn_rate: float,
+        rng: Generator,
+        regime_multipliers: dict = None,
+        monthly_churn_prob: Optional[float] = None
+    ) -> Tuple[int, int, float, float]:
+        """
+        Run one sales-phase month: leads, closings, churn, revenue, costs.
+        
+        Equivalent to calling ``process_new_leads``,
+        ``process_pipeline_closings``, ``apply_churn``, ``compute_revenue``
+        and ``compute_costs`` in turn, but executed by the compiled
+        ``kernels._step_month_nb`` when the distributions allow it.
+        
+        If ``monthly_churn_prob`` is given (e.g. looked up from a table
+        precomputed with ``monthly_churn_probability``), it is used as
+        is; otherwise it is derived from ``annual_churn_rate`` and the
+        churn multiplier.
+        
+        Returns
+        -------
+        tuple
+            (new_customers, churned, revenue, costs)
+        """
+        regime_multipliers = regime_multipliers or {}
+        
+        if not self._use_kernel:
+            self.process_new_leads(
+                state, month, n_leads,
+                win_rate_bumn, win_rate_open, bumn_ratio,
+                rng, regime_multipliers
+            )
+            new_customers = self.process_pipeline_closings(state, month)
+            if monthly_churn_prob is None:
+                churned = self.apply_churn(state, annual_churn_rate, rng, regime_multipliers)
+            else:
+                churned = int(rng.binomial(state.customers, monthly_churn_prob))
+                state.customers -= churned
+            revenue = self.compute_revenue(state, self.compute_avg_contract_value(), regime_multipliers)
+            costs = self.compute_costs(state, False, 0, regime_multipliers)
+            return new_customers, churned, revenue, costs
+        
+        params = np.zeros(kernels.N_PARAMS)
+        params[kernels.P_WIN_RATE_BUMN] = win_rate_bumn
+        params[kernels.P_WIN_RATE_OPEN] = win_rate_open
+        params[kernels.P_BUMN_RATIO] = bumn_ratio
+        self._fill_model_params(params)
+        
+        if monthly_churn_prob is None:
+            monthly_churn_prob = monthly_churn_probability(
+                annual_churn_rate, regime_multipliers.get('churn_multiplier', 1.0)
+            )
+        
+        mults = np.ones(kernels.N_MULTIPLIERS)
+        mults[kernels.M_WIN_RATE] = regime_multipliers.get('win_rate_multiplier', 1.0)
+        mults[kernels.M_CHURN_PROB] = monthly_churn_prob
+        mults[kernels.M_REVENUE] = regime_multipliers.get('revenue_multiplier', 1.0)
+        mults[kernels.M_COST] = regime_multipliers.get('cost_multiplier', 1.0)
+        
+        pipeline = state.pipeline
+        pipeline.reserve(n_leads)
+        
+        (pipeline.length, state.customers,
+         new_customers, churned, revenue, costs) = kernels._step_month_nb(
+            pipeline.entry_month, pipeline.close_month, pipeline.will_convert,
+            pipeline.contract_value, pipeline.is_bumn,
+            pipeline.length, state.customers, month, n_leads,
+            params, mults,
+            self._size_cdf, self._contract_mu, self._contract_sigma,
+            rng
+        )
+        
+        return new_customers, churned, revenue, costs
+    
+    def simulate_paths(
+        self,
+        params: NDArray,
+        month_mults: NDArray,
+        rngs: Sequence[Generator],
+        contract_mu: Optional[NDArray] = None,
+        contract_sigma: Optional[NDArray] = None
+    ) -> Dict[str, NDArray]:
+        """
+        Simulate many paths in parallel under precomputed multipliers.
+        
+        Batched form of ``simulate_path``: every path runs
+        ``kernels._simulate_core`` on its own generator inside a single
+        ``prange`` kernel, so no Python objects cross thread boundaries.
+        
+        Parameters
+        ----------
+        params : NDArray
+            (n_paths, kernels.N_PARAMS) path parameters; the model-level
+            columns are filled in here
+        month_mults : NDArray
+            (n_paths, n_months, kernels.N_MULTIPLIERS) monthly multipliers
+        rngs : sequence of Generator
+            One independent generator per path
+        contract_mu, contract_sigma : NDArray, optional
+            (n_paths, n_sizes) lognormal contract parameters per path, in
+            ``self.sizes`` order. Defaults to the model's own contracts;
+            when given, each path's average contract value follows them.
+            
+        Returns
+        -------
+        dict
+            ``equity_curves`` (n_paths, n_months + 1), ``monthly_pnl``
+            (n_paths, n_months), ``customer_series`` (n_paths,
+            n_months + 1) and per-path ``max_drawdown``,
+            ``breakeven_month``, ``is_ruin`` and ``n_simulated``.
+            Equity curves are stored as float32 to halve the memory
+            traffic of aggregation; capital is accumulated, and drawdown
+            and breakeven tracked, in float64 inside the kernel.
+        """
+        if not self._use_kernel:
+            raise ValueError(
+                "simulate_paths requires lognormal contract distributions "
+                "and a gamma sales cycle"
+            )
+        
+        n_paths, n_months = month_mults.shape[0], month_mults.shape[1]
+        if params.shape[0] != n_paths or len(rngs) != n_paths:
+            raise ValueError(
+                f"params ({params.shape[0]}), month_mults ({n_paths}) "
+                f"and rngs ({len(rngs)}) must have one entry per path"
+            )
+        
+        params = np.array(params, dtype=np.float64)
+        self._fill_model_params(params)
+        
+        if contract_mu is None or contract_sigma is None:
+            contract_mu = np.broadcast_to(self._contract_mu, (n_paths, len(self.sizes)))
+            contract_sigma = np.broadcast_to(self._contract_sigma, (n_paths, len(self.sizes)))
+        else:
+            params[:, kernels.P_AVG_CONTRACT] = (
+                np.exp(contract_mu + 0.5 * contract_sigma ** 2) @ self._probs_arr
+            )
+        
+        out = {
+            'equity_curves': np.empty((n_paths, n_months + 1), dtype=np.float32),
+            'monthly_pnl': np.empty((n_paths, n_months)),
+            'customer_series': np.empty((n_paths, n_months + 1), dtype=np.int64),
+            'max_drawdown': np.empty(n_paths),
+            'breakeven_month': np.empty(n_paths, dtype=np.int64),
+            'is_ruin': np.empty(n_paths, dtype=np.bool_),
+            'n_simulated': np.empty(n_paths, dtype=np.int64),
+        }
+        
+        kernels._simulate_paths_nb(
+            params,
+            np.ascontiguousarray(month_mults, dtype=np.float64),
+            self._size_cdf,
+            np.ascontiguousarray(contract_mu, dtype=np.float64),
+            np.ascontiguousarray(contract_sigma, dtype=np.float64),
+            typed_list(rngs),
+            out['equity_curves'], out['monthly_pnl'], out['customer_series'],
+            out['max_drawdown'], out['breakeven_month'], out['is_ruin'],
+            out['n_simulated']
+        )
+        
+        return out
+    
+    def simulate_path(
+        self,
+        params: NDArray,
+        month_mults: NDArray,
+        rng: Generator,
+        equity_curve: NDArray,
+        monthly_pnl: NDArray,
+        customer_series: NDArray
+    ) -> Tuple[float, int, bool, int]:
+        """
+        Simulate one complete path under precomputed monthly multipliers.
+        
+        Runs ``kernels._simulate_core`` when the distributions allow it
+        and an equivalent loop over ``step_month`` otherwise.
+        
+        Parameters
+        ----------
+        params : NDArray
+            Path parameters in the kernel params layout; the model-level
+            columns are filled in here
+        month_mults : NDArray
+            (n_months, kernels.N_MULTIPLIERS) multipliers for each month,
+            with ``M_CHURN_PROB`` holding the monthly churn probability
+        rng : Generator
+            Random number generator
+        equity_curve, monthly_pnl, customer_series : NDArray
+            Output series of length n_months + 1, n_months and
+            n_months + 1, written in place
             
-            # Get effective win rate
-            base_win = win_rate_bumn if is_bumn else win_rate_open
-            effective_win = min(1.0, base_win * win_mult)
+        Returns
+        -------
+        tuple
+            (max_drawdown, breakeven_month, is_ruin, n_simulated)
+        """
+        if self._use_kernel:
+            params = np.array(params, dtype=np.float64)
+            self._fill_model_params(params)
+            return kernels._simulate_core(
+                params, np.ascontiguousarray(month_mults, dtype=np.float64),
+                self._size_cdf, self._contract_mu, self._contract_sigma,
+                rng,
+                equity_curve, monthly_pnl, customer_series
+            )
+        
+        initial_capital = params[kernels.P_INITIAL_CAPITAL]
+        dev_duration = params[kernels.P_DEV_DURATION]
+        state = BusinessState(
+            capital=initial_capital,
+            customers=0,
+            peak_capital=initial_capital
+        )
+        equity_curve[0] = initial_capital
+        customer_series[0] = 0
+        
+        n_months = monthly_pnl.shape[0]
+        
+        # Lead rates are known for every month up front, so all lead
+        # arrivals come from one vectorized draw (none during development)
+        lead_rates = np.where(
+            np.arange(n_months) < dev_duration,
+            0.0,
+            np.maximum(0.0, params[kernels.P_LEADS_PER_MONTH] * month_mults[:, kernels.M_ADOPTION])
+        )
+        lead_draws = rng.poisson(lead_rates)
+        
+        for month in range(n_months):
+            mults = month_mults[month]
+            if month < dev_duration:
+                revenue = 0.0
+                costs = params[kernels.P_DEV_BURN] * mults[kernels.M_COST]
+            else:
+                _, _, revenue, costs = self.step_month(
+                    state, month, int(lead_draws[month]),
+                    params[kernels.P_WIN_RATE_BUMN], params[kernels.P_WIN_RATE_OPEN],
+                    params[kernels.P_BUMN_RATIO], 0.0, rng,
+                    {
+                        'win_rate_multiplier': mults[kernels.M_WIN_RATE],
+                        'revenue_multiplier': mults[kernels.M_REVENUE],
+                        'cost_multiplier': mults[kernels.M_COST],
+                    },
+                    monthly_churn_prob=mults[kernels.M_CHURN_PROB]
+                )
             
-            # Determine if will convert
-            will_convert = rng.random() < effective_win
+            net_flow = revenue - costs
+            state.capital += net_flow
+            state.update_drawdown()
+            if state.breakeven_month == -1 and state.capital >= initial_capital and month >= dev_duration:
+                state.breakeven_month = month + 1
             
-            # Sample contract value and sales cycle
-            _, contract_value = self.sample_contract_value(rng)
-            cycle = self.sample_sales_cycle(rng)
+            monthly_pnl[month] = net_flow
+            equity_curve[month + 1] = state.capital
+            customer_series[month + 1] = state.customers
             
-            # Create pipeline deal
-            deal = PipelineDeal(
-                entry_month=month,
-                close_month=month + cycle,
-                will_convert=will_convert,
-                contract_value=contract_value,
-                is_bumn=is_bumn
-            )
-            state.pipeline.append(deal)
+            if state.capital <= 0:
+                equity_curve[month + 2:] = state.capital
+                customer_series[month + 2:] = 0
+                monthly_pnl[month + 1:] = 0.0
+                return state.max_drawdown, state.breakeven_month, True, month + 1
         
-        return n_leads
+        return state.max_drawdown, state.breakeven_month, False, n_months
+    
+    def _fill_model_params(self, params: NDArray) -> None:
+        """Write the model-level columns of a kernel params array."""
+        params[..., kernels.P_AVG_CONTRACT] = self._avg_contract
+        params[..., kernels.P_OP_OVERHEAD] = self.op_overhead
+        params[..., kernels.P_COST_PER_CUSTOMER] = self.cost_per_customer
+        params[..., kernels.P_CYCLE_SHAPE] = self.sales_cycle_dist.shape
+        params[..., kernels.P_CYCLE_SCALE] = self.sales_cycle_dist.scale
     
     def process_pipeline_closings(
         self,
@@ -244,18 +697,16 @@ class BusinessModel:
         int
             Number of new customers acquired
         """
-        closing_deals = [
-            d for d in state.pipeline 
-            if d.close_month <= month and d.will_convert
-        ]
+        pipeline = state.pipeline
+        n = pipeline.length
+        close_month = pipeline.close_month[:n]
         
-        # Remove closed deals from pipeline
-        state.pipeline = [
-            d for d in state.pipeline 
-            if d.close_month > month or not d.will_convert
-        ]
+        # One due mask drives both outcomes: due deals that convert become
+        # customers, and every due deal (won or lost) leaves the pipeline
+        due = close_month <= month
+        new_customers = int(np.count_nonzero(due & pipeline.will_convert[:n]))
+        pipeline.compact(~due)
         
-        new_customers = len(closing_deals)
         state.customers += new_customers
         
         return new_customers
@@ -284,15 +735,12 @@ class BusinessModel:
         regime_multipliers = regime_multipliers or {}
         churn_mult = regime_multipliers.get('churn_multiplier', 1.0)
         
-        # Convert annual to monthly
-        effective_annual = min(0.99, annual_churn_rate * churn_mult)
-        monthly_churn_prob = 1 - (1 - effective_annual) ** (1/12)
-        
-        # Sample number of churns (binomial)
-        churned = rng.binomial(state.customers, monthly_churn_prob)
-        state.customers = max(0, state.customers - churned)
+        remaining, churned = apply_churn_batch(
+            state.customers, annual_churn_rate, churn_mult, rng
+        )
+        state.customers = int(remaining)
         
-        return churned
+        return int(churned)
     
     def compute_revenue(
         self,
@@ -14,16 +14,17 @@ Architecture:
 Parallelization:
 ---------------
 Paths are embarrassingly parallel - each can run independently.
-We use joblib for parallel execution with proper RNG management.
+Per-path inputs (sampled parameters, regime and risk multipliers) are
+prepared up front, then every path's month loop runs inside a single
+Numba ``prange`` kernel, each path on its own generator.
 """
 
 import numpy as np
-from numpy.random import Generator, SeedSequence, PCG64
+from numpy.random import Generator, PCG64
 from numpy.typing import NDArray
 from dataclasses import dataclass
-from typing import List, Dict, Optional, Tuple, Any
+from typing import List, Dict, Optional, Sequence, Tuple, Any, Union
 import time
-from joblib import Parallel, delayed
 
 from ..distributions import (
     BaseDistribution,
@@ -46,9 +47,16 @@ from ..models.results import (
     SimulationMeta,
     RecommendationType,
 )
+from . import kernels
 from .business_model import BusinessModel
 from .risk_events import RiskEventManager, RiskEventConfig
-from .path import PathSimulator, PathResult
+from .path import PathSimulator, PathResult, PathResultsBatch
+from ...utils.jit import thread_limit
+from ...utils.math_helpers import partition_percentile, sorted_percentile, tail_mean
+
+
+# Coefficient of variation of contract values around each size's mean
+CONTRACT_VALUE_CV = 0.1
 
 
 def create_distribution(spec: DistributionSpec) -> BaseDistribution:
@@ -197,61 +205,148 @@ class SimulationEngine:
         
         return configs
     
+    def _sample_parameter_batch(self, n: int, rng: Generator) -> Dict[str, NDArray]:
+        """
+        Sample all input parameters for ``n`` simulations at once.
+        
+        Each distribution is drawn from once with ``size=n``, in the
+        field order of ``SampledParameters``; the probabilities are then
+        clipped to [0, 1] together.
+        
+        Returns
+        -------
+        dict
+            Mapping from ``SampledParameters`` field name to an array of
+            ``n`` values
+        """
+        dists = self.distributions
+        
+        def draw(name: str) -> NDArray:
+            return dists[name].sample(size=n, rng=rng)
+        
+        initial_capital = draw('initial_capital')
+        dev_duration = np.rint(draw('dev_duration')).astype(np.int64)
+        dev_burn = draw('dev_burn')
+        leads_per_month = draw('leads_per_month')
+        rates = np.empty((3, n))
+        rates[0] = draw('win_rate_bumn')
+        rates[1] = draw('win_rate_open')
+        rates[2] = draw('churn_rate')
+        np.clip(rates, 0, 1, out=rates)
+        
+        return {
+            'initial_capital': initial_capital,
+            'dev_duration': dev_duration,
+            'dev_burn': dev_burn,
+            'leads_per_month': leads_per_month,
+            'win_rate_bumn': rates[0],
+            'win_rate_open': rates[1],
+            'bumn_ratio': np.full(n, float(self.input.sales.bumn_ratio)),
+            'annual_churn_rate': rates[2],
+            'contract_small': draw('contract_small'),
+            'contract_medium': draw('contract_medium'),
+            'contract_large': draw('contract_large'),
+        }
+    
     def _sample_parameters(self, rng: Generator) -> SampledParameters:
         """Sample all input parameters for one simulation."""
-        return SampledParameters(
-            initial_capital=float(self.distributions['initial_capital'].sample(rng=rng)[0]),
-            dev_duration=int(round(self.distributions['dev_duration'].sample(rng=rng)[0])),
-            dev_burn=float(self.distributions['dev_burn'].sample(rng=rng)[0]),
-            leads_per_month=float(self.distributions['leads_per_month'].sample(rng=rng)[0]),
-            win_rate_bumn=float(np.clip(self.distributions['win_rate_bumn'].sample(rng=rng)[0], 0, 1)),
-            win_rate_open=float(np.clip(self.distributions['win_rate_open'].sample(rng=rng)[0], 0, 1)),
-            bumn_ratio=self.input.sales.bumn_ratio,
-            annual_churn_rate=float(np.clip(self.distributions['churn_rate'].sample(rng=rng)[0], 0, 1)),
-            contract_small=float(self.distributions['contract_small'].sample(rng=rng)[0]),
-            contract_medium=float(self.distributions['contract_medium'].sample(rng=rng)[0]),
-            contract_large=float(self.distributions['contract_large'].sample(rng=rng)[0]),
-        )
+        return self._sampled_at(self._sample_parameter_batch(1, rng), 0)
     
-    def _run_single_path(self, seed: int) -> PathResult:
-        """Run a single path simulation with given seed."""
-        rng = Generator(PCG64(seed))
-        
-        # Sample parameters
-        params = self._sample_parameters(rng)
-        
-        # Create business model
-        contract_dists = {
-            'small': LogNormalDistribution.from_mean_cv(params.contract_small, 0.1),
-            'medium': LogNormalDistribution.from_mean_cv(params.contract_medium, 0.1),
-            'large': LogNormalDistribution.from_mean_cv(params.contract_large, 0.1),
+    @staticmethod
+    def make_path_rngs(seed: int, n_paths: int) -> List[Generator]:
+        """
+        Create one independent generator per path via PCG64 jump-ahead.
+        
+        Path ``i`` gets the base PCG64 stream advanced by ``i`` jumps of
+        2^127 draws, so streams never overlap and path ``i`` sees the
+        same numbers regardless of worker count or scheduling. Each
+        stream carries only 128 bits of state.
+        
+        New code should use PCG64 streams like these rather than
+        MT19937, whose ~2.5 KB state per stream is wasteful across
+        thousands of paths. Jumping also needs no per-path
+        ``SeedSequence`` spawn or ``generate_state`` call: each stream is
+        the previous one advanced by a single jump.
+        
+        Parameters
+        ----------
+        seed : int
+            Base seed for the simulation
+        n_paths : int
+            Number of paths
+            
+        Returns
+        -------
+        List[Generator]
+            Generator for each path, in path order
+        """
+        rngs = []
+        bit_generator = PCG64(seed)
+        for _ in range(n_paths):
+            rngs.append(Generator(bit_generator))
+            bit_generator = bit_generator.jumped()
+        return rngs
+    
+    @staticmethod
+    def _sampled_at(batch: Dict[str, NDArray], i: int) -> SampledParameters:
+        """Row ``i`` of a parameter batch as ``SampledParameters``."""
+        return SampledParameters(**{name: values[i].item() for name, values in batch.items()})
+    
+    @staticmethod
+    def _contract_distributions(params: SampledParameters) -> Dict[str, LogNormalDistribution]:
+        """Contract value distribution per PT size for sampled parameters."""
+        return {
+            'small': LogNormalDistribution.from_mean_cv(params.contract_small, CONTRACT_VALUE_CV),
+            'medium': LogNormalDistribution.from_mean_cv(params.contract_medium, CONTRACT_VALUE_CV),
+            'large': LogNormalDistribution.from_mean_cv(params.contract_large, CONTRACT_VALUE_CV),
         }
-        
+    
+    def _create_business_model(self, params: SampledParameters) -> BusinessModel:
+        """Create the business model for a set of sampled parameters."""
+        contract_dists = self._contract_distributions(params)
         sales_cycle_dist = GammaDistribution.from_mean_cv(mean=5.0, cv=0.3)
         
-        business_model = BusinessModel(
+        return BusinessModel(
             contract_distributions=contract_dists,
             size_weights=self.input.pricing.size_distribution,
             sales_cycle_dist=sales_cycle_dist,
             op_overhead=self.input.retention_costs.op_overhead,
             cost_per_customer=self.input.retention_costs.cost_per_customer
         )
-        
-        # Create risk manager if enabled
+    
+    def _create_path_simulator(self, business_model: BusinessModel) -> PathSimulator:
+        """Create a path simulator (with its own risk manager, if enabled)."""
         risk_manager = None
         if self.input.config.enable_risk_events and self.risk_configs:
             risk_manager = RiskEventManager(self.risk_configs)
         
-        # Create path simulator
-        simulator = PathSimulator(
+        return PathSimulator(
             business_model=business_model,
             regime_model=self.regime_model,
             risk_manager=risk_manager,
             time_horizon=self.input.config.time_horizon
         )
+    
+    def _run_single_path(
+        self,
+        rng: Generator,
+        params: Optional[SampledParameters] = None
+    ) -> PathResult:
+        """
+        Run a single path simulation with its own generator.
+        
+        Parameters are sampled from ``rng`` unless given. With path
+        ``i``'s generator and row ``i`` of the parameter batch it
+        reproduces path ``i`` of ``run`` when risk events are disabled,
+        which is handy for inspecting one path in isolation. (``run``
+        draws every path's risk events from one shared stream, so with
+        risk events enabled the path is an equally likely alternative.)
+        """
+        if params is None:
+            params = self._sample_parameters(rng)
+        simulator = self._create_path_simulator(self._create_business_model(params))
         
-        # Run simulation
-        result = simulator.simulate(
+        return simulator.simulate(
             initial_capital=params.initial_capital,
             dev_duration=params.dev_duration,
             dev_burn=params.dev_burn,
@@ -262,64 +357,104 @@ class SimulationEngine:
             annual_churn_rate=params.annual_churn_rate,
             rng=rng
         )
-        
-        return result
     
-    def run(self) -> Tuple[List[PathResult], float]:
+    def run(self) -> Tuple[PathResultsBatch, float]:
         """
         Run the full Monte Carlo simulation.
         
+        Each path's parameters, regime path and risk events are drawn
+        first; the month loops of all paths then run in one parallel
+        compiled kernel on ``n_jobs`` threads.
+        
         Returns
         -------
         tuple
-            (list of PathResult, computation_time_ms)
+            (PathResultsBatch, computation_time_ms). The batch holds the
+            kernel's output arrays and doubles as a sequence of
+            ``PathResult`` for path-by-path analysis.
         """
         start_time = time.time()
         
         n_sims = self.input.config.n_simulations
         base_seed = self.input.config.seed or int(time.time() * 1000) % (2**31)
         
-        # Generate seeds for each simulation
-        seed_seq = SeedSequence(base_seed)
-        seeds = [int(s.generate_state(1)[0]) for s in seed_seq.spawn(n_sims)]
+        # Independent, non-overlapping stream for each simulation, plus
+        # two more (after them) for the parameter and risk event draws
+        rngs = self.make_path_rngs(base_seed, n_sims)
+        params_rng = Generator(PCG64(base_seed).jumped(n_sims))
+        risk_rng = Generator(PCG64(base_seed).jumped(n_sims + 1))
+        
+        # Every input parameter for every path, one draw per distribution
+        sampled = self._sample_parameter_batch(n_sims, params_rng)
+        churn_rates = sampled['annual_churn_rate']
+        
+        params = np.zeros((n_sims, kernels.N_PARAMS))
+        PathSimulator.pack_params(
+            sampled['initial_capital'], sampled['dev_duration'], sampled['dev_burn'],
+            sampled['leads_per_month'], sampled['win_rate_bumn'],
+            sampled['win_rate_open'], sampled['bumn_ratio'],
+            out=params
+        )
         
-        # Run simulations (parallel or serial)
-        if self.n_jobs == 1:
-            # Serial execution (useful for debugging)
-            results = [self._run_single_path(seed) for seed in seeds]
-        else:
-            # Parallel execution
-            results = Parallel(n_jobs=self.n_jobs)(
-                delayed(self._run_single_path)(seed) for seed in seeds
+        # Paths share everything but their contract values, which are
+        # passed to the kernel as per-path lognormal parameters
+        business_model = self._create_business_model(self._sampled_at(sampled, 0))
+        simulator = self._create_path_simulator(business_model)
+        
+        n_sizes = len(business_model.sizes)
+        contract_mu = np.empty((n_sims, n_sizes))
+        contract_sigma = np.empty((n_sims, n_sizes))
+        for j, size in enumerate(business_model.sizes):
+            contract_mu[:, j], contract_sigma[:, j] = LogNormalDistribution.log_params_from_mean_cv(
+                sampled[f'contract_{size}'], CONTRACT_VALUE_CV
             )
         
+        # Regime paths (each on its path's stream) and risk events (all
+        # paths stepped together on the shared risk stream)
+        regime_indices, month_mults, shock_timelines = simulator.sample_multipliers_batch(
+            churn_rates, rngs, risk_rng
+        )
+        
+        # Month loops of every path, in parallel
+        with thread_limit(self.n_jobs):
+            out = business_model.simulate_paths(
+                params, month_mults, rngs, contract_mu, contract_sigma
+            )
+        
+        results = simulator.build_batch(
+            params, churn_rates, out, regime_indices, shock_timelines
+        )
+        
         computation_time = (time.time() - start_time) * 1000  # ms
         
         return results, computation_time
     
     def aggregate_results(
         self, 
-        path_results: List[PathResult],
+        path_results: Union[PathResultsBatch, Sequence[PathResult]],
         computation_time_ms: float
     ) -> SimulationResult:
         """
         Aggregate path results into summary statistics.
         
         This is where we compute all the metrics shown in the dashboard.
+        Takes the batch returned by ``run`` (or a list of ``PathResult``,
+        which is stacked into one first).
         """
+        if not isinstance(path_results, PathResultsBatch):
+            path_results = PathResultsBatch.from_results(path_results)
+        
         n_sims = len(path_results)
         time_horizon = self.input.config.time_horizon
         
-        # Extract arrays for vectorized computation
-        final_capitals = np.array([r.final_capital for r in path_results])
-        initial_capitals = np.array([r.initial_capital for r in path_results])
-        returns = np.array([r.total_return for r in path_results])
-        max_drawdowns = np.array([r.max_drawdown for r in path_results])
-        breakeven_months = np.array([r.breakeven_month for r in path_results])
-        is_ruin = np.array([r.is_ruin for r in path_results])
-        
-        # Stack equity curves
-        equity_curves = np.vstack([r.equity_curve for r in path_results])
+        # Per-path arrays, read straight from the batch
+        final_capitals = path_results.final_capital
+        initial_capitals = path_results.initial_capital
+        returns = path_results.total_return
+        max_drawdowns = path_results.max_drawdown
+        breakeven_months = path_results.breakeven_month
+        is_ruin = path_results.is_ruin
+        equity_curves = path_results.equity_curves
         
         # === SUMMARY STATISTICS ===
         avg_initial = float(np.mean(initial_capitals))
@@ -328,19 +463,24 @@ class SimulationEngine:
         prob_double = float(np.mean(returns >= 100))
         prob_ruin = float(np.mean(is_ruin))
         
+        # One sort each serves every percentile and tail mean below; the
+        # return order also picks the sample paths and the worst 5%
+        return_order = np.argsort(returns)
+        sorted_returns = returns[return_order]
         return_mean = float(np.mean(returns))
-        return_median = float(np.median(returns))
         return_std = float(np.std(returns))
-        return_p5 = float(np.percentile(returns, 5))
-        return_p95 = float(np.percentile(returns, 95))
+        return_p5, return_median, return_p95 = sorted_percentile(sorted_returns, [5, 50, 95]).tolist()
         
-        # VaR and CVaR (as capital loss)
+        # VaR and CVaR (as capital loss) at the 1%, 5% and 10% levels
         losses = initial_capitals - final_capitals
-        var_5 = float(np.percentile(losses, 95))  # 5% worst loss
-        cvar_5 = float(np.mean(losses[losses >= np.percentile(losses, 95)]))
+        sorted_losses = np.sort(losses)
+        var_10, var_5, var_1 = sorted_percentile(sorted_losses, [90, 95, 99]).tolist()
+        cvar_10, cvar_5, cvar_1 = (
+            tail_mean(sorted_losses, var) for var in (var_10, var_5, var_1)
+        )
         
         max_dd_mean = float(np.mean(max_drawdowns))
-        max_dd_p95 = float(np.percentile(max_drawdowns, 95))
+        max_dd_p50, max_dd_p95, max_dd_p99 = partition_percentile(max_drawdowns, [50, 95, 99]).tolist()
         
         # Breakeven
         achieved_breakeven = breakeven_months > 0
@@ -376,28 +516,19 @@ class SimulationEngine:
         )
         
         # === PATH DATA ===
-        percentiles = []
-        for month in range(time_horizon + 1):
-            month_values = equity_curves[:, month]
-            percentiles.append(PathPercentile(
-                month=month,
-                p5=float(np.percentile(month_values, 5)),
-                p25=float(np.percentile(month_values, 25)),
-                p50=float(np.percentile(month_values, 50)),
-                p75=float(np.percentile(month_values, 75)),
-                p95=float(np.percentile(month_values, 95))
-            ))
+        # Percentile bands for every month in one call, shape (5, T + 1)
+        bands = np.percentile(equity_curves, [5, 25, 50, 75, 95], axis=0)
+        percentiles = [
+            PathPercentile(month=month, p5=p5, p25=p25, p50=p50, p75=p75, p95=p95)
+            for month, (p5, p25, p50, p75, p95) in enumerate(bands.T.tolist())
+        ]
         
         # Sample paths for visualization (50 representative paths)
         n_sample = min(50, n_sims)
         sample_indices = np.linspace(0, n_sims - 1, n_sample, dtype=int)
-        sorted_by_return = np.argsort(returns)
-        sample_paths = [
-            equity_curves[sorted_by_return[i]].tolist()
-            for i in sample_indices
-        ]
+        sample_paths = equity_curves[return_order[sample_indices]].astype(np.float32)
         
-        median_path = [p.p50 for p in percentiles]
+        median_path = bands[2].astype(np.float32)
         
         paths = PathData(
             percentiles=percentiles,
@@ -406,11 +537,18 @@ class SimulationEngine:
         )
         
         # === OUTCOME DISTRIBUTION ===
+        # Category per path (ruin implies a loss of all capital, so the
+        # categories are exclusive): 0 double+, 1 profitable, 2 loss, 3 ruin
+        category = np.where(
+            is_ruin, 3,
+            np.where(returns >= 100, 0, np.where(returns > 0, 1, 2))
+        )
+        double_plus, profitable, loss, ruin = np.bincount(category, minlength=4).tolist()
         outcomes = OutcomeDistribution(
-            double_plus=int(np.sum(returns >= 100)),
-            profitable=int(np.sum((returns > 0) & (returns < 100))),
-            loss=int(np.sum((returns <= 0) & ~is_ruin)),
-            ruin=int(np.sum(is_ruin)),
+            double_plus=double_plus,
+            profitable=profitable,
+            loss=loss,
+            ruin=ruin,
             total=n_sims
         )
         
@@ -418,42 +556,46 @@ class SimulationEngine:
         bucket_size = 50
         min_ret = int(np.floor(returns.min() / bucket_size) * bucket_size)
         max_ret = int(np.ceil(returns.max() / bucket_size) * bucket_size)
+        n_buckets = (max_ret - min_ret) // bucket_size
+        
+        # Buckets are [start, start + size); a maximum falling exactly on
+        # max_ret lies past the last bucket and is not counted
+        bucket_idx = np.floor_divide(returns - min_ret, bucket_size).astype(np.int64)
+        counts = np.bincount(bucket_idx[bucket_idx < n_buckets], minlength=n_buckets)
         
-        return_buckets = []
-        for start in range(min_ret, max_ret, bucket_size):
-            count = int(np.sum((returns >= start) & (returns < start + bucket_size)))
-            return_buckets.append(ReturnBucket(
+        return_buckets = [
+            ReturnBucket(
                 range_start=start,
                 range_end=start + bucket_size,
                 count=count,
                 percentage=count / n_sims * 100
-            ))
+            )
+            for start, count in zip(range(min_ret, max_ret, bucket_size), counts.tolist())
+        ]
         
         # === RISK METRICS ===
         # Survival curve
-        survival_curve = []
-        for month in range(time_horizon + 1):
-            survived = np.sum(equity_curves[:, month] > 0) / n_sims
-            survival_curve.append(float(survived))
+        survival_curve = (equity_curves > 0).mean(axis=0).tolist()
         
-        # Months underwater
-        underwater = equity_curves < initial_capitals.reshape(-1, 1)
-        months_underwater = np.sum(underwater, axis=1)
+        # Months underwater, compared at the curves' precision so a month
+        # at exactly initial capital is not counted through rounding
+        with thread_limit(self.n_jobs):
+            months_underwater = kernels._months_underwater_nb(
+                equity_curves, initial_capitals.astype(equity_curves.dtype)
+            )
         
-        # Tail loss (worst 5%)
-        worst_5pct_idx = returns <= np.percentile(returns, 5)
-        tail_loss_mean = float(np.mean(initial_capitals[worst_5pct_idx] - final_capitals[worst_5pct_idx]))
+        # Tail loss (worst 5%): the paths with returns <= p5 lead the order
+        n_tail = np.searchsorted(sorted_returns, return_p5, side='right')
+        tail_loss_mean = float(np.mean(losses[return_order[:n_tail]]))
         
         risk_metrics = RiskMetrics(
-            var={"1": float(np.percentile(losses, 99)), "5": var_5, "10": float(np.percentile(losses, 90))},
-            cvar={"1": float(np.mean(losses[losses >= np.percentile(losses, 99)])),
-                  "5": cvar_5,
-                  "10": float(np.mean(losses[losses >= np.percentile(losses, 90)]))},
+            var={"1": var_1, "5": var_5, "10": var_10},
+            cvar={"1": cvar_1, "5": cvar_5, "10": cvar_10},
             drawdown_mean=max_dd_mean,
             drawdown_std=float(np.std(max_drawdowns)),
-            drawdown_p50=float(np.median(max_drawdowns)),
+            drawdown_p50=max_dd_p50,
             drawdown_p95=max_dd_p95,
-            drawdown_p99=float(np.percentile(max_drawdowns, 99)),
+            drawdown_p99=max_dd_p99,
             months_underwater_mean=float(np.mean(months_underwater)),
             survival_curve=survival_curve,
             tail_loss_mean=tail_loss_mean
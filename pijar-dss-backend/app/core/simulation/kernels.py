@@ -0,0 +1,354 @@
+"""
+Compiled Kernels for the Monthly Business Loop.
+
+The per-month business operations (lead intake, pipeline closings,
+churn, revenue and costs) are plain scalar arithmetic. Run through
+dataclasses and dict lookups, the interpreter dominates their cost, so
+the hot body lives here as Numba kernels operating on the pipeline's
+parallel arrays.
+
+Kernels take a NumPy ``Generator`` directly. Numba supports Generator
+objects natively, and without Numba the same code runs as ordinary
+Python (see ``app.utils.jit``), so results are identical either way.
+
+Batches of paths run under ``prange``; every path owns its Generator,
+so results do not depend on how paths are spread across threads.
+
+Parameter Layout:
+----------------
+Scalar inputs are packed into a float64 vector indexed by the ``P_*``
+constants, and the combined regime/risk multipliers into a vector
+indexed by the ``M_*`` constants. Whole-path kernels take one such
+vector per month, with regime and risk effects already resolved.
+Contract sizes are passed as a cumulative probability vector with
+matching lognormal (μ, σ) arrays.
+"""
+
+import numpy as np
+from numpy.typing import NDArray
+
+from ..processes.poisson import _fast_poisson
+from ...utils.jit import njit, prange
+
+
+# Indices into the params vector
+P_WIN_RATE_BUMN = 0
+P_WIN_RATE_OPEN = 1
+P_BUMN_RATIO = 2
+P_AVG_CONTRACT = 3
+P_OP_OVERHEAD = 4
+P_COST_PER_CUSTOMER = 5
+P_CYCLE_SHAPE = 6
+P_CYCLE_SCALE = 7
+P_INITIAL_CAPITAL = 8
+P_DEV_DURATION = 9
+P_DEV_BURN = 10
+P_LEADS_PER_MONTH = 11
+N_PARAMS = 12
+
+# Indices into the multipliers vector. M_CHURN_PROB is not a multiplier
+# but the month's churn probability with base rate and multipliers
+# already applied, so the annual-to-monthly pow stays out of the kernel.
+M_WIN_RATE = 0
+M_CHURN_PROB = 1
+M_REVENUE = 2
+M_COST = 3
+M_ADOPTION = 4
+N_MULTIPLIERS = 5
+
+# Initial per-path pipeline capacity; grown by doubling when exceeded
+PIPELINE_CAPACITY = 64
+
+
+@njit(cache=True)
+def _grow(arr: NDArray, capacity: int) -> NDArray:
+    """Copy ``arr`` into a new buffer of ``capacity`` slots."""
+    new = np.empty(capacity, dtype=arr.dtype)
+    new[:arr.shape[0]] = arr
+    return new
+
+
+@njit(cache=True, fastmath=True)
+def _step_month_nb(
+    entry_month: NDArray,
+    close_month: NDArray,
+    will_convert: NDArray,
+    contract_value: NDArray,
+    is_bumn: NDArray,
+    length: int,
+    customers: int,
+    month: int,
+    n_leads: int,
+    params: NDArray,
+    mults: NDArray,
+    size_cdf: NDArray,
+    contract_mu: NDArray,
+    contract_sigma: NDArray,
+    rng
+):
+    """
+    Advance one sales-phase month.
+
+    Appends ``n_leads`` deals after slot ``length`` (the caller must
+    guarantee capacity), closes due deals, compacts the pipeline in
+    place and applies churn.
+
+    Returns
+    -------
+    tuple
+        (length, customers, new_customers, churned, revenue, costs)
+    """
+    # 1. New leads enter the pipeline
+    win_mult = mults[M_WIN_RATE]
+    for i in range(length, length + n_leads):
+        bumn = rng.random() < params[P_BUMN_RATIO]
+        base_win = params[P_WIN_RATE_BUMN] if bumn else params[P_WIN_RATE_OPEN]
+        effective_win = min(1.0, base_win * win_mult)
+
+        entry_month[i] = month
+        is_bumn[i] = bumn
+        will_convert[i] = rng.random() < effective_win
+
+        size = np.searchsorted(size_cdf, rng.random(), side='right')
+        contract_value[i] = rng.lognormal(contract_mu[size], contract_sigma[size])
+
+        cycle = rng.gamma(params[P_CYCLE_SHAPE], params[P_CYCLE_SCALE])
+        close_month[i] = month + max(1, int(np.rint(cycle)))
+    length += n_leads
+
+    # 2. Close due deals and compact the survivors to the front
+    new_customers = 0
+    kept = 0
+    for i in range(length):
+        if close_month[i] <= month:
+            if will_convert[i]:
+                new_customers += 1
+        else:
+            if kept != i:
+                entry_month[kept] = entry_month[i]
+                close_month[kept] = close_month[i]
+                will_convert[kept] = will_convert[i]
+                contract_value[kept] = contract_value[i]
+                is_bumn[kept] = is_bumn[i]
+            kept += 1
+    length = kept
+    customers += new_customers
+
+    # 3. Churn
+    churned = 0
+    if customers > 0:
+        churned = rng.binomial(customers, mults[M_CHURN_PROB])
+        customers = max(0, customers - churned)
+
+    # 4. Revenue and costs
+    revenue = customers * (params[P_AVG_CONTRACT] / 12.0) * mults[M_REVENUE]
+    costs = (params[P_OP_OVERHEAD] + customers * params[P_COST_PER_CUSTOMER]) * mults[M_COST]
+
+    return length, customers, new_customers, churned, revenue, costs
+
+
+@njit(cache=True)
+def _reserve(pipeline, needed: int):
+    """Return ``pipeline`` with room for ``needed`` deals, doubling if short."""
+    entry_month, close_month, will_convert, contract_value, is_bumn = pipeline
+    capacity = close_month.shape[0]
+    if needed <= capacity:
+        return pipeline
+
+    capacity = max(needed, 2 * capacity)
+    return (
+        _grow(entry_month, capacity),
+        _grow(close_month, capacity),
+        _grow(will_convert, capacity),
+        _grow(contract_value, capacity),
+        _grow(is_bumn, capacity),
+    )
+
+
+@njit(cache=True)
+def _advance_month_nb(
+    month: int,
+    mults: NDArray,
+    pipeline,
+    length: int,
+    customers: int,
+    params: NDArray,
+    size_cdf: NDArray,
+    contract_mu: NDArray,
+    contract_sigma: NDArray,
+    rng
+):
+    """
+    One month of business operations under the multipliers ``mults``.
+
+    During development only the burn is charged. Afterwards lead
+    arrivals are drawn and the month step runs. ``pipeline`` is the
+    tuple of the five pipeline arrays; it is returned because it may
+    have been reallocated to fit new leads.
+
+    Returns
+    -------
+    tuple
+        (pipeline, length, customers, new_customers, churned,
+        revenue, costs)
+    """
+    # Development phase: burn only
+    if month < params[P_DEV_DURATION]:
+        costs = params[P_DEV_BURN] * mults[M_COST]
+        return pipeline, length, customers, 0, 0, 0.0, costs
+
+    # Lead arrivals
+    lead_rate = max(0.0, params[P_LEADS_PER_MONTH] * mults[M_ADOPTION])
+    n_leads = _fast_poisson(rng, lead_rate)
+
+    # Pipeline, churn, revenue and costs
+    pipeline = _reserve(pipeline, length + n_leads)
+    entry_month, close_month, will_convert, contract_value, is_bumn = pipeline
+    length, customers, new_customers, churned, revenue, costs = _step_month_nb(
+        entry_month, close_month, will_convert, contract_value, is_bumn,
+        length, customers, month, n_leads,
+        params, mults,
+        size_cdf, contract_mu, contract_sigma,
+        rng
+    )
+
+    return pipeline, length, customers, new_customers, churned, revenue, costs
+
+
+@njit(cache=True)
+def _simulate_core(
+    params: NDArray,
+    month_mults: NDArray,
+    size_cdf: NDArray,
+    contract_mu: NDArray,
+    contract_sigma: NDArray,
+    rng,
+    equity_curve: NDArray,
+    monthly_pnl: NDArray,
+    customer_series: NDArray
+):
+    """
+    Simulate one path month by month, writing its time series in place.
+
+    ``params`` is one row of the params layout and ``month_mults`` holds
+    one multipliers row per month, so regime and risk effects are
+    resolved before the call. After ruin the remaining months hold the
+    final capital, zero customers and zero P&L.
+
+    Returns
+    -------
+    tuple
+        (max_drawdown, breakeven_month, is_ruin, n_simulated), with
+        ``n_simulated`` the number of months run before stopping
+    """
+    n_months = monthly_pnl.shape[0]
+    initial_capital = params[P_INITIAL_CAPITAL]
+    dev_duration = params[P_DEV_DURATION]
+
+    pipeline = (
+        np.empty(PIPELINE_CAPACITY, dtype=np.int32),
+        np.empty(PIPELINE_CAPACITY, dtype=np.int32),
+        np.empty(PIPELINE_CAPACITY, dtype=np.bool_),
+        np.empty(PIPELINE_CAPACITY, dtype=np.float64),
+        np.empty(PIPELINE_CAPACITY, dtype=np.bool_),
+    )
+    length = 0
+
+    capital = initial_capital
+    customers = 0
+    peak_capital = initial_capital
+    max_drawdown = 0.0
+    breakeven_month = -1
+
+    equity_curve[0] = initial_capital
+    customer_series[0] = 0
+
+    for month in range(n_months):
+        (pipeline, length, customers,
+         _, _, revenue, costs) = _advance_month_nb(
+            month, month_mults[month],
+            pipeline, length, customers, params,
+            size_cdf, contract_mu, contract_sigma,
+            rng
+        )
+        net_flow = revenue - costs
+        capital += net_flow
+
+        if capital > peak_capital:
+            peak_capital = capital
+        if peak_capital > 0:
+            max_drawdown = max(max_drawdown, (peak_capital - capital) / peak_capital)
+
+        if breakeven_month == -1 and capital >= initial_capital and month >= dev_duration:
+            breakeven_month = month + 1
+
+        monthly_pnl[month] = net_flow
+        equity_curve[month + 1] = capital
+        customer_series[month + 1] = customers
+
+        if capital <= 0:
+            equity_curve[month + 2:] = capital
+            customer_series[month + 2:] = 0
+            monthly_pnl[month + 1:] = 0.0
+            return max_drawdown, breakeven_month, True, month + 1
+
+    return max_drawdown, breakeven_month, False, n_months
+
+
+@njit(cache=True, parallel=True)
+def _simulate_paths_nb(
+    params: NDArray,
+    month_mults: NDArray,
+    size_cdf: NDArray,
+    contract_mu: NDArray,
+    contract_sigma: NDArray,
+    rngs,
+    equity_curves: NDArray,
+    monthly_pnl: NDArray,
+    customer_series: NDArray,
+    max_drawdown: NDArray,
+    breakeven_month: NDArray,
+    is_ruin: NDArray,
+    n_simulated: NDArray
+) -> None:
+    """
+    Run ``_simulate_core`` for ``n_paths`` paths in parallel.
+
+    Row ``i`` of ``params`` / ``month_mults`` (n_paths, n_months,
+    N_MULTIPLIERS) / ``contract_mu`` / ``contract_sigma`` (n_paths,
+    n_sizes) and of every output belongs to path ``i``, which draws
+    only from ``rngs[i]``.
+    """
+    n_paths = params.shape[0]
+    for i in prange(n_paths):
+        rng = rngs[np.int64(i)]
+        dd, breakeven, ruin, n_months = _simulate_core(
+            params[i], month_mults[i],
+            size_cdf, contract_mu[i], contract_sigma[i],
+            rng,
+            equity_curves[i], monthly_pnl[i], customer_series[i]
+        )
+        max_drawdown[i] = dd
+        breakeven_month[i] = breakeven
+        is_ruin[i] = ruin
+        n_simulated[i] = n_months
+
+
+@njit(cache=True, parallel=True)
+def _months_underwater_nb(equity_curves: NDArray, initial_capitals: NDArray) -> NDArray:
+    """
+    Per path, the number of months with equity below initial capital.
+    
+    Same as ``(equity_curves < initial_capitals[:, None]).sum(axis=1)``
+    but streams each row once without materializing the boolean matrix.
+    """
+    n_paths, n_points = equity_curves.shape
+    out = np.empty(n_paths, dtype=np.int64)
+    for i in prange(n_paths):
+        threshold = initial_capitals[i]
+        count = 0
+        for t in range(n_points):
+            if equity_curves[i, t] < threshold:
+                count += 1
+        out[i] = count
+    return out
@@ -22,7 +22,7 @@ import numpy as np
 from numpy.random import Generator
 from numpy.typing import NDArray
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
 from ..distributions import (
     TriangularDistribution,
@@ -30,9 +30,14 @@ from ..distributions import (
     LogNormalDistribution,
     GammaDistribution,
 )
-from ..processes import PoissonProcess, RegimeSwitchingModel, RegimeType
-from .business_model import BusinessModel, BusinessState
-from .risk_events import RiskEventManager, RiskEventConfig
+from ..processes import RegimeSwitchingModel, RegimeType
+from ..processes.regime import R_WIN_RATE, R_CHURN, R_RISK_INTENSITY
+from . import kernels
+from .business_model import BusinessModel, monthly_churn_probability
+from .risk_events import (
+    RiskEventManager, RiskEventConfig, BatchedRiskEventManager,
+    Impact, IMPACT_TYPES
+)
 
 
 @dataclass
@@ -67,6 +72,119 @@ class PathResult:
     realized_params: Dict[str, float]
 
 
+@dataclass
+class PathResultsBatch:
+    """
+    Results of many paths in struct-of-arrays layout.
+    
+    Row ``i`` of every array belongs to path ``i``. The arrays are the
+    kernel outputs themselves, so aggregation reads them directly
+    instead of stacking per-path objects. The batch is also a sequence
+    of ``PathResult``: indexing or iterating builds per-path views
+    (sharing the row memory) on first use, for analysis code that works
+    path by path.
+    """
+    # Core outcomes, shape (n_paths,)
+    initial_capital: NDArray
+    final_capital: NDArray
+    total_return: NDArray  # (final - initial) / initial * 100
+    max_drawdown: NDArray  # As percentage
+    breakeven_month: NDArray  # -1 if never achieved
+    is_ruin: NDArray
+    
+    # Time series, shape (n_paths, n_months + 1) / (n_paths, n_months)
+    equity_curves: NDArray
+    monthly_pnl: NDArray
+    customer_series: NDArray
+    
+    # Regime data: indices into regime_names, -1 after a path stopped
+    regime_paths: NDArray
+    regime_names: List[str]
+    months_in_stress: NDArray
+    
+    # Months simulated before each path stopped (ruin)
+    n_simulated: NDArray
+    
+    # Risk event data
+    total_shocks: NDArray
+    shock_timelines: List[List[Tuple[int, str, float]]]
+    
+    # Parameter realizations, one array per parameter
+    realized_params: Dict[str, NDArray]
+    
+    _results: Optional[List[PathResult]] = field(default=None, init=False, repr=False)
+    
+    def __len__(self) -> int:
+        return self.final_capital.shape[0]
+    
+    def __getitem__(self, i: int) -> PathResult:
+        return self.to_results()[i]
+    
+    def __iter__(self) -> Iterator[PathResult]:
+        return iter(self.to_results())
+    
+    def to_results(self) -> List[PathResult]:
+        """Per-path ``PathResult`` views, built once and cached."""
+        if self._results is None:
+            self._results = [self._path_result(i) for i in range(len(self))]
+        return self._results
+    
+    def _path_result(self, i: int) -> PathResult:
+        n = int(self.n_simulated[i])
+        names = self.regime_names
+        return PathResult(
+            initial_capital=float(self.initial_capital[i]),
+            final_capital=float(self.final_capital[i]),
+            total_return=float(self.total_return[i]),
+            max_drawdown=float(self.max_drawdown[i]),
+            breakeven_month=int(self.breakeven_month[i]),
+            is_ruin=bool(self.is_ruin[i]),
+            equity_curve=self.equity_curves[i],
+            monthly_pnl=self.monthly_pnl[i],
+            customer_series=self.customer_series[i],
+            regime_path=[names[k] for k in self.regime_paths[i, :n].tolist()],
+            months_in_stress=int(self.months_in_stress[i]),
+            total_shocks=int(self.total_shocks[i]),
+            shock_timeline=self.shock_timelines[i],
+            realized_params={k: v[i].item() for k, v in self.realized_params.items()}
+        )
+    
+    @classmethod
+    def from_results(cls, results: Sequence[PathResult]) -> 'PathResultsBatch':
+        """Stack individual path results into a batch."""
+        names = sorted({name for r in results for name in r.regime_path})
+        name_idx = {name: k for k, name in enumerate(names)}
+        n_months = len(results[0].monthly_pnl)
+        
+        regime_paths = np.full((len(results), n_months), -1, dtype=np.int64)
+        for i, r in enumerate(results):
+            regime_paths[i, :len(r.regime_path)] = [name_idx[name] for name in r.regime_path]
+        
+        batch = cls(
+            initial_capital=np.array([r.initial_capital for r in results]),
+            final_capital=np.array([r.final_capital for r in results]),
+            total_return=np.array([r.total_return for r in results]),
+            max_drawdown=np.array([r.max_drawdown for r in results]),
+            breakeven_month=np.array([r.breakeven_month for r in results]),
+            is_ruin=np.array([r.is_ruin for r in results]),
+            equity_curves=np.vstack([r.equity_curve for r in results]),
+            monthly_pnl=np.vstack([r.monthly_pnl for r in results]),
+            customer_series=np.vstack([r.customer_series for r in results]),
+            regime_paths=regime_paths,
+            regime_names=names,
+            months_in_stress=np.array([r.months_in_stress for r in results]),
+            n_simulated=np.array([len(r.regime_path) for r in results]),
+            total_shocks=np.array([r.total_shocks for r in results]),
+            shock_timelines=[r.shock_timeline for r in results],
+            realized_params={
+                k: np.array([r.realized_params[k] for r in results])
+                for k in results[0].realized_params
+            },
+        )
+        batch._results = list(results)
+        return batch
+
+
 class PathSimulator:
     """
     Simulates a single path of the business.
@@ -141,173 +259,323 @@ class PathSimulator:
         PathResult
             Complete path results
         """
-        # Initialize state
-        state = BusinessState(
-            capital=initial_capital,
-            customers=0,
-            peak_capital=initial_capital
+        regime_indices, month_mults, shock_timeline = self.sample_multipliers(
+            annual_churn_rate, rng
+        )
+        params = self.pack_params(
+            initial_capital, dev_duration, dev_burn, leads_per_month,
+            win_rate_bumn, win_rate_open, bumn_ratio
+        )
+        
+        # The month loop itself runs compiled
+        T = self.time_horizon
+        equity_curve = np.empty(T + 1)
+        monthly_pnl = np.empty(T)
+        customer_series = np.empty(T + 1, dtype=np.int64)
+        max_drawdown, breakeven_month, is_ruin, n_simulated = self.business_model.simulate_path(
+            params, month_mults, rng, equity_curve, monthly_pnl, customer_series
+        )
+        
+        return self.build_result(
+            params, annual_churn_rate,
+            equity_curve, monthly_pnl, customer_series,
+            max_drawdown, breakeven_month, is_ruin, n_simulated,
+            regime_indices, shock_timeline
         )
+    
+    def sample_multipliers(
+        self,
+        annual_churn_rate: float,
+        rng: Generator
+    ) -> Tuple[NDArray, NDArray, List[Tuple[int, str, float]]]:
+        """
+        Draw the regime path and risk events and combine their effects.
         
-        # Initialize tracking arrays
-        equity_curve = np.zeros(self.time_horizon + 1)
-        equity_curve[0] = initial_capital
-        monthly_pnl = np.zeros(self.time_horizon)
-        customer_series = np.zeros(self.time_horizon + 1, dtype=np.int64)
+        The regime is carried as an integer index into ``regime_order``
+        and its multipliers read from the model's params matrix. Risk
+        events are stepped month by month against the regime path.
         
-        # Initialize regime
-        regime_path = []
-        current_regime = RegimeType.NORMAL
-        months_in_stress = 0
+        Returns
+        -------
+        tuple
+            (regime_indices, month_mults, shock_timeline): the regime
+            index of each month, the (time_horizon,
+            kernels.N_MULTIPLIERS) multipliers for the compiled loop, and
+            every shock as (month, type, severity)
+        """
+        T = self.time_horizon
         
+        # 1. Regime path
         if self.regime_model:
-            current_regime = self.regime_model.initial_regime
+            regime_indices = self.regime_model.simulate_regime_indices(T, rng)[1:]
+            regime_rows = self.regime_model.params_matrix[regime_indices]
+        else:
+            regime_indices = np.zeros(T, dtype=np.int64)
+            # A single neutral regime: every multiplier is 1
+            regime_rows = np.ones((T, 6))
         
-        # Initialize risk tracking
+        # 2. Risk events
+        risk_mults = np.ones((T, len(IMPACT_TYPES)))
+        shock_timeline = []
         if self.risk_manager:
             self.risk_manager.reset()
-        shock_timeline = []
-        total_shocks = 0
+            for month in range(T):
+                new_shocks = self.risk_manager.check_for_arrivals(
+                    month, rng, regime_rows[month, R_RISK_INTENSITY]
+                )
+                for shock in new_shocks:
+                    shock_timeline.append((month, shock.impact_type, shock.severity))
+                
+                self.risk_manager.process_recoveries(rng)
+                self.risk_manager.get_multiplier_array(out=risk_mults[month])
         
-        # Lead arrival process
-        lead_process = PoissonProcess(base_rate=leads_per_month)
+        # 3. Combined multipliers per month
+        month_mults = self._combine_multipliers(annual_churn_rate, regime_rows, risk_mults)
         
-        # Compute average contract value
-        avg_contract = self.business_model.compute_avg_contract_value()
+        return regime_indices, month_mults, shock_timeline
+    
+    def sample_multipliers_batch(
+        self,
+        annual_churn_rates: NDArray,
+        rngs: Sequence[Generator],
+        risk_rng: Generator
+    ) -> Tuple[NDArray, NDArray, List[List[Tuple[int, str, float]]]]:
+        """
+        ``sample_multipliers`` for many paths at once.
+        
+        Each path's regime path is drawn from its own generator, as in
+        ``sample_multipliers``. Risk events of all paths are stepped
+        together by a ``BatchedRiskEventManager`` on ``risk_rng``, so a
+        month costs a few array operations for the whole batch rather
+        than one Python step per path.
+        
+        Returns
+        -------
+        tuple
+            (regime_indices, month_mults, shock_timelines): arrays of
+            shape (n_paths, time_horizon) and (n_paths, time_horizon,
+            kernels.N_MULTIPLIERS), and each path's shocks as
+            (month, type, severity)
+        """
+        T = self.time_horizon
+        n_paths = len(rngs)
+        
+        # 1. Regime paths
+        if self.regime_model:
+            regime_indices = np.empty((n_paths, T), dtype=np.int64)
+            for i, rng in enumerate(rngs):
+                regime_indices[i] = self.regime_model.simulate_regime_indices(T, rng)[1:]
+            regime_rows = self.regime_model.params_matrix[regime_indices]
+        else:
+            regime_indices = np.zeros((n_paths, T), dtype=np.int64)
+            regime_rows = np.ones((n_paths, T, 6))
+        
+        # 2. Risk events, every path per step
+        risk_mults = np.ones((n_paths, T, len(IMPACT_TYPES)))
+        shock_timelines = [[] for _ in range(n_paths)]
+        if self.risk_manager:
+            manager = BatchedRiskEventManager(self.risk_manager.events, n_paths)
+            impact_types = [e.impact_type for e in manager.events]
+            for month in range(T):
+                paths, events, severities = manager.check_for_arrivals(
+                    month, risk_rng, regime_rows[:, month, R_RISK_INTENSITY]
+                )
+                for path, event, severity in zip(paths.tolist(), events.tolist(), severities.tolist()):
+                    shock_timelines[path].append((month, impact_types[event], severity))
+                
+                manager.process_recoveries(risk_rng)
+                manager.get_multiplier_array(out=risk_mults[:, month])
+        
+        # 3. Combined multipliers per path and month
+        month_mults = self._combine_multipliers(
+            np.asarray(annual_churn_rates)[:, None], regime_rows, risk_mults
+        )
+        
+        return regime_indices, month_mults, shock_timelines
+    
+    @staticmethod
+    def _combine_multipliers(
+        annual_churn_rate: Union[float, NDArray],
+        regime_rows: NDArray,
+        risk_mults: NDArray
+    ) -> NDArray:
+        """
+        Kernel multipliers from regime rows and risk multipliers.
+        
+        Win rate follows the regime, adoption follows risk shocks and
+        churn both. Revenue and cost are not scaled in either phase, as
+        in the original monthly loop. Works on any leading shape
+        (months, or paths × months); ``annual_churn_rate`` must
+        broadcast against it.
+        """
+        month_mults = np.ones(regime_rows.shape[:-1] + (kernels.N_MULTIPLIERS,))
+        month_mults[..., kernels.M_WIN_RATE] = regime_rows[..., R_WIN_RATE]
+        month_mults[..., kernels.M_ADOPTION] = risk_mults[..., Impact.ADOPTION]
+        month_mults[..., kernels.M_CHURN_PROB] = monthly_churn_probability(
+            annual_churn_rate, regime_rows[..., R_CHURN] * risk_mults[..., Impact.CHURN]
+        )
+        return month_mults
+    
+    @staticmethod
+    def pack_params(
+        initial_capital: float,
+        dev_duration: int,
+        dev_burn: float,
+        leads_per_month: float,
+        win_rate_bumn: float,
+        win_rate_open: float,
+        bumn_ratio: float,
+        out: Optional[NDArray] = None
+    ) -> NDArray:
+        """
+        Write path parameters into a ``kernels`` params vector.
+        
+        With array arguments and an ``out`` of shape (n_paths,
+        kernels.N_PARAMS), fills the columns of a whole batch at once.
+        """
+        params = np.zeros(kernels.N_PARAMS) if out is None else out
+        params[..., kernels.P_INITIAL_CAPITAL] = initial_capital
+        params[..., kernels.P_DEV_DURATION] = dev_duration
+        params[..., kernels.P_DEV_BURN] = dev_burn
+        params[..., kernels.P_LEADS_PER_MONTH] = leads_per_month
+        params[..., kernels.P_WIN_RATE_BUMN] = win_rate_bumn
+        params[..., kernels.P_WIN_RATE_OPEN] = win_rate_open
+        params[..., kernels.P_BUMN_RATIO] = bumn_ratio
+        return params
+    
+    def build_result(
+        self,
+        params: NDArray,
+        annual_churn_rate: float,
+        equity_curve: NDArray,
+        monthly_pnl: NDArray,
+        customer_series: NDArray,
+        max_drawdown: float,
+        breakeven_month: int,
+        is_ruin: bool,
+        n_simulated: int,
+        regime_indices: NDArray,
+        shock_timeline: List[Tuple[int, str, float]]
+    ) -> PathResult:
+        """
+        Assemble a ``PathResult`` from the compiled loop's outputs.
+        
+        Regime names and shocks are only reported for the ``n_simulated``
+        months run before the path stopped.
+        """
+        regime_names, stress_idx = self._regime_labels()
+        
+        regime_indices = regime_indices[:n_simulated]
+        regime_path = [regime_names[i] for i in regime_indices.tolist()]
+        months_in_stress = int(np.count_nonzero(regime_indices == stress_idx))
+        shock_timeline = [s for s in shock_timeline if s[0] < n_simulated]
         
         # Store realized parameters for sensitivity analysis
+        initial_capital = float(params[kernels.P_INITIAL_CAPITAL])
         realized_params = {
             'initial_capital': initial_capital,
-            'dev_duration': dev_duration,
-            'dev_burn': dev_burn,
-            'leads_per_month': leads_per_month,
-            'win_rate_bumn': win_rate_bumn,
-            'win_rate_open': win_rate_open,
+            'dev_duration': int(params[kernels.P_DEV_DURATION]),
+            'dev_burn': float(params[kernels.P_DEV_BURN]),
+            'leads_per_month': float(params[kernels.P_LEADS_PER_MONTH]),
+            'win_rate_bumn': float(params[kernels.P_WIN_RATE_BUMN]),
+            'win_rate_open': float(params[kernels.P_WIN_RATE_OPEN]),
             'annual_churn_rate': annual_churn_rate
         }
         
-        # Main simulation loop
-        is_ruin = False
-        
-        for month in range(self.time_horizon):
-            # 1. Sample regime for this month
-            if self.regime_model:
-                current_regime = self.regime_model.sample_next_regime(current_regime, rng)
-                regime_params = self.regime_model.get_parameters(current_regime)
-                regime_multipliers = regime_params.to_dict()
-                
-                if current_regime == RegimeType.STRESS:
-                    months_in_stress += 1
-            else:
-                regime_multipliers = {}
-            
-            regime_path.append(current_regime.value if self.regime_model else 'normal')
-            
-            # 2. Check for risk events
-            risk_multipliers = {'adoption': 1.0, 'churn': 1.0, 'revenue': 1.0, 'cost': 1.0}
-            
-            if self.risk_manager:
-                risk_intensity_mult = regime_multipliers.get('risk_intensity_multiplier', 1.0)
-                new_shocks = self.risk_manager.check_for_arrivals(month, rng, risk_intensity_mult)
-                
-                for shock in new_shocks:
-                    shock_timeline.append((month, shock.impact_type, shock.severity))
-                    total_shocks += 1
-                
-                self.risk_manager.process_recoveries(rng)
-                risk_multipliers = self.risk_manager.get_multipliers()
-            
-            # 3. Combine regime and risk multipliers
-            combined_multipliers = {
-                k: regime_multipliers.get(f'{k}_multiplier', 1.0) * risk_multipliers.get(k, 1.0)
-                for k in ['adoption', 'churn', 'revenue', 'cost']
-            }
-            combined_multipliers['win_rate_multiplier'] = regime_multipliers.get('win_rate_multiplier', 1.0)
-            
-            # 4. Determine if in development phase
-            is_dev_phase = month < dev_duration
-            
-            # 5. Business operations
-            if is_dev_phase:
-                # Development: no revenue, only burn
-                revenue = 0.0
-                costs = self.business_model.compute_costs(
-                    state, True, dev_burn, combined_multipliers
-                )
-                new_customers = 0
-                churned = 0
-            else:
-                # Sales phase
-                # 5a. Generate leads
-                effective_lead_rate = leads_per_month * combined_multipliers.get('adoption', 1.0)
-                n_leads = rng.poisson(max(0, effective_lead_rate))
-                
-                # 5b. Process new leads into pipeline
-                self.business_model.process_new_leads(
-                    state, month, n_leads,
-                    win_rate_bumn, win_rate_open, bumn_ratio,
-                    rng, combined_multipliers
-                )
-                
-                # 5c. Process pipeline closings
-                new_customers = self.business_model.process_pipeline_closings(state, month)
-                
-                # 5d. Apply churn
-                effective_churn = annual_churn_rate * combined_multipliers.get('churn', 1.0)
-                churned = self.business_model.apply_churn(state, effective_churn, rng)
-                
-                # 5e. Compute revenue and costs
-                revenue = self.business_model.compute_revenue(state, avg_contract, combined_multipliers)
-                costs = self.business_model.compute_costs(state, False, 0, combined_multipliers)
-            
-            # 6. Update capital
-            net_flow = revenue - costs
-            state.capital += net_flow
-            
-            # 7. Update tracking
-            state.update_drawdown()
-            
-            if state.breakeven_month == -1 and state.capital >= initial_capital and not is_dev_phase:
-                state.breakeven_month = month + 1
-            
-            # Record time series
-            monthly_pnl[month] = net_flow
-            equity_curve[month + 1] = state.capital
-            customer_series[month + 1] = state.customers
-            
-            state.monthly_revenues.append(revenue)
-            state.monthly_costs.append(costs)
-            state.monthly_customers.append(state.customers)
-            state.monthly_new_customers.append(new_customers)
-            state.monthly_churned.append(churned)
-            
-            # 8. Check for ruin
-            if state.capital <= 0:
-                is_ruin = True
-                # Fill remaining months with final state
-                for future_month in range(month + 2, self.time_horizon + 1):
-                    equity_curve[future_month] = state.capital
-                    customer_series[future_month] = 0
-                for future_month in range(month + 1, self.time_horizon):
-                    monthly_pnl[future_month] = 0
-                break
-        
         # Compute final metrics
-        final_capital = state.capital
+        final_capital = float(equity_curve[n_simulated])
         total_return = (final_capital - initial_capital) / initial_capital * 100
         
         return PathResult(
             initial_capital=initial_capital,
             final_capital=final_capital,
             total_return=total_return,
-            max_drawdown=state.max_drawdown * 100,
-            breakeven_month=state.breakeven_month,
-            is_ruin=is_ruin,
+            max_drawdown=float(max_drawdown) * 100,
+            breakeven_month=int(breakeven_month),
+            is_ruin=bool(is_ruin),
             equity_curve=equity_curve,
             monthly_pnl=monthly_pnl,
             customer_series=customer_series,
             regime_path=regime_path,
             months_in_stress=months_in_stress,
-            total_shocks=total_shocks,
+            total_shocks=len(shock_timeline),
             shock_timeline=shock_timeline,
             realized_params=realized_params
-        )
\ No newline at end of file
+        )
+    
+    def build_batch(
+        self,
+        params: NDArray,
+        annual_churn_rates: NDArray,
+        outputs: Dict[str, NDArray],
+        regime_indices: NDArray,
+        shock_timelines: List[List[Tuple[int, str, float]]]
+    ) -> PathResultsBatch:
+        """
+        Assemble a ``PathResultsBatch`` from batched kernel outputs.
+        
+        Parameters
+        ----------
+        params : NDArray
+            (n_paths, kernels.N_PARAMS) path parameters
+        annual_churn_rates : NDArray
+            Sampled annual churn rate per path
+        outputs : dict
+            Result of ``BusinessModel.simulate_paths``
+        regime_indices : NDArray
+            (n_paths, time_horizon) regime index of each month; entries
+            after a path stopped are overwritten with -1
+        shock_timelines : list
+            Shocks of each path as (month, type, severity)
+        """
+        regime_names, stress_idx = self._regime_labels()
+        n_simulated = outputs['n_simulated']
+        
+        months = np.arange(regime_indices.shape[1])
+        regime_indices[months >= n_simulated[:, None]] = -1
+        shock_timelines = [
+            [s for s in shocks if s[0] < n] if n < self.time_horizon else shocks
+            for shocks, n in zip(shock_timelines, n_simulated.tolist())
+        ]
+        
+        initial_capital = params[:, kernels.P_INITIAL_CAPITAL].copy()
+        final_capital = outputs['equity_curves'][:, -1].astype(np.float64)
+        
+        return PathResultsBatch(
+            initial_capital=initial_capital,
+            final_capital=final_capital,
+            total_return=(final_capital - initial_capital) / initial_capital * 100,
+            max_drawdown=outputs['max_drawdown'] * 100,
+            breakeven_month=outputs['breakeven_month'],
+            is_ruin=outputs['is_ruin'],
+            equity_curves=outputs['equity_curves'],
+            monthly_pnl=outputs['monthly_pnl'],
+            customer_series=outputs['customer_series'],
+            regime_paths=regime_indices,
+            regime_names=regime_names,
+            months_in_stress=np.count_nonzero(regime_indices == stress_idx, axis=1),
+            n_simulated=n_simulated,
+            total_shocks=np.array([len(shocks) for shocks in shock_timelines]),
+            shock_timelines=shock_timelines,
+            realized_params={
+                'initial_capital': initial_capital,
+                'dev_duration': params[:, kernels.P_DEV_DURATION].astype(np.int64),
+                'dev_burn': params[:, kernels.P_DEV_BURN].copy(),
+                'leads_per_month': params[:, kernels.P_LEADS_PER_MONTH].copy(),
+                'win_rate_bumn': params[:, kernels.P_WIN_RATE_BUMN].copy(),
+                'win_rate_open': params[:, kernels.P_WIN_RATE_OPEN].copy(),
+                'annual_churn_rate': np.asarray(annual_churn_rates, dtype=np.float64),
+            },
+        )
+    
+    def _regime_labels(self) -> Tuple[List[str], int]:
+        """Regime names by index, and the stress regime's index (or -1)."""
+        if not self.regime_model:
+            return ['normal'], -1
+        
+        regime_order = self.regime_model.regime_order
+        stress_idx = (
+            regime_order.index(RegimeType.STRESS)
+            if RegimeType.STRESS in regime_order else -1
+        )
+        return [r.value for r in regime_order], stress_idx
\ No newline at end of file
@@ -22,10 +22,83 @@ import numpy as np
 from numpy.random import Generator
 from numpy.typing import NDArray
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional
+from enum import IntEnum
+from typing import List, Dict, Optional, Tuple
 
 from ..distributions import TriangularDistribution
+from ..distributions.triangular import _triangular_icdf
 from ..processes import PoissonProcess
+from ...utils.jit import njit
+
+
+class Impact(IntEnum):
+    """Impact types, valued by their column in multiplier arrays."""
+    ADOPTION = 0
+    CHURN = 1
+    REVENUE = 2
+    COST = 3
+    
+    @classmethod
+    def code(cls, impact_type: str) -> int:
+        """
+        Column of an impact type name, or -1 if it is not a known type.
+        
+        Names are matched exactly in lowercase ("churn", not "Churn").
+        """
+        return _IMPACT_CODES.get(impact_type, -1)
+
+
+# Impact type names in column order
+IMPACT_TYPES = tuple(impact.name.lower() for impact in Impact)
+_IMPACT_CODES = {name: code for code, name in enumerate(IMPACT_TYPES)}
+
+# Fraction of the remaining gap to 1.0 that a shock recovers each month
+PARTIAL_RECOVERY = 0.2
+
+# Storage type of active-shock severities and recovery rates. Single
+# precision is ample for these and halves the state the monthly steps
+# stream through; aggregated multipliers are still float64.
+SHOCK_DTYPE = np.float32
+
+
+@njit(cache=True)
+def _arrival_rates_nb(
+    base_rates: NDArray,
+    first_month: NDArray,
+    last_month: NDArray,
+    month: int,
+    regime_multiplier: float
+) -> NDArray:
+    """Each event's arrival rate this month; zero outside its window."""
+    rates = np.zeros(base_rates.size)
+    for i in range(base_rates.size):
+        if first_month[i] <= month <= last_month[i]:
+            rates[i] = base_rates[i] * regime_multiplier
+    return rates
+
+
+@njit(cache=True)
+def _recovery_step_nb(severity: NDArray, recovery_rate: NDArray, u: NDArray):
+    """
+    One month of recovery for every active shock, in a single pass.
+    
+    ``u`` holds one uniform draw per shock: a shock recovers fully when
+    its draw falls below its recovery rate, and otherwise moves
+    ``PARTIAL_RECOVERY`` of the way back to 1.0.
+    
+    Returns
+    -------
+    tuple
+        (keep, severity): mask of the shocks still active, and the
+        updated severities (entries of recovered shocks are unused)
+    """
+    n = severity.size
+    keep = np.empty(n, dtype=np.bool_)
+    updated = np.empty(n, dtype=severity.dtype)
+    for i in range(n):
+        keep[i] = u[i] >= recovery_rate[i]
+        updated[i] = severity[i] + (1.0 - severity[i]) * PARTIAL_RECOVERY
+    return keep, updated
 
 
 @dataclass
@@ -45,12 +118,18 @@ class ActiveShock:
         Monthly probability of full recovery
     start_month : int
         Month when shock occurred
+    impact_code : int
+        ``Impact`` column of impact_type (-1 if unknown); derived
     """
     event_name: str
     impact_type: str
     severity: float
     recovery_rate: float
     start_month: int
+    impact_code: int = field(default=-1, init=False, repr=False)
+    
+    def __post_init__(self):
+        self.impact_code = Impact.code(self.impact_type)
 
 
 @dataclass
@@ -63,6 +142,73 @@ class RiskEventConfig:
     recovery_rate: float
     start_month: int = 1
     end_month: Optional[int] = None
+    impact_code: int = field(default=-1, init=False, repr=False)
+    
+    def __post_init__(self):
+        # Integer column of impact_type (-1 if unknown), so hot paths
+        # index arrays instead of hashing the name
+        self.impact_code = Impact.code(self.impact_type)
+
+
+def _event_tables(events: List[RiskEventConfig]) -> Tuple[NDArray, ...]:
+    """
+    Flat per-event arrays used by the vectorized monthly steps.
+    
+    Returns
+    -------
+    tuple
+        (base_rates, first_month, last_month, impact, recovery_rate):
+        monthly arrival rates; the 0-based active window, where an
+        end_month of None (or 0) never ends; the impact column in
+        ``IMPACT_TYPES`` order (-1 for an unknown type, which affects no
+        multiplier); and the recovery rates
+    """
+    base_rates = np.array([e.intensity / 12 for e in events], dtype=np.float64)
+    first_month = np.array([e.start_month - 1 for e in events], dtype=np.int64)
+    last_month = np.array(
+        [e.end_month - 1 if e.end_month else np.iinfo(np.int64).max for e in events],
+        dtype=np.int64
+    )
+    impact = np.array([e.impact_code for e in events], dtype=np.int64)
+    recovery_rate = np.array([e.recovery_rate for e in events], dtype=SHOCK_DTYPE)
+    return base_rates, first_month, last_month, impact, recovery_rate
+
+
+def _severity_tables(events: List[RiskEventConfig]) -> Tuple[NDArray, NDArray, NDArray]:
+    """Per-event (low, mode, high) of the triangular severity distributions."""
+    low = np.array([e.severity_dist.min_val for e in events], dtype=np.float64)
+    mode = np.array([e.severity_dist.mode for e in events], dtype=np.float64)
+    high = np.array([e.severity_dist.max_val for e in events], dtype=np.float64)
+    return low, mode, high
+
+
+def _log_severities(severity: NDArray) -> NDArray:
+    """
+    Severities in log space (float64), so stacked shocks combine by sum.
+    
+    A zero severity maps to -inf, which exponentiates back to a zero
+    multiplier.
+    """
+    with np.errstate(divide='ignore'):
+        return np.log(severity, dtype=np.float64)
+
+
+def _draw_severities(
+    severity_tables: Tuple[NDArray, NDArray, NDArray],
+    events: NDArray,
+    rng: Generator
+) -> NDArray:
+    """
+    One severity per arrival, for arrivals of any mix of events.
+    
+    The events' triangular parameters are gathered per arrival, so all
+    severities come from a single uniform draw through the inverse CDF.
+    They are returned as ``SHOCK_DTYPE``, as stored.
+    """
+    low, mode, high = severity_tables
+    return _triangular_icdf(
+        rng.random(events.size), low[events], mode[events], high[events]
+    ).astype(SHOCK_DTYPE)
 
 
 class RiskEventManager:
@@ -78,15 +224,53 @@ class RiskEventManager:
         List of risk event configurations
     """
     
+    # Initial shock slots; grown by doubling when exceeded
+    INITIAL_CAPACITY = 16
+    
     def __init__(self, events: List[RiskEventConfig]):
         self.events = events
-        self.active_shocks: List[ActiveShock] = []
         
         # Create Poisson processes for each event
         self._arrival_processes = {
             e.name: PoissonProcess(base_rate=e.intensity / 12)  # Monthly rate
             for e in events
         }
+        
+        # The same rates and active windows as flat arrays over events,
+        # so a month's arrivals for every event are one vectorized draw
+        (self._base_rates, self._first_month, self._last_month,
+         self._event_impact, self._event_recovery) = _event_tables(events)
+        self._severity_tables = _severity_tables(events)
+        
+        self.reset()
+    
+    @property
+    def active_shocks(self) -> List[ActiveShock]:
+        """
+        The currently active shocks, as ``ActiveShock`` objects.
+        
+        Shocks are stored as parallel arrays (one entry per shock:
+        severity, recovery rate, impact column, start month and event
+        index), so every monthly operation is a vectorized step over
+        them. The arrays are preallocated and the first ``n_active``
+        entries hold the active shocks, in arrival order. This view is
+        built on demand and is a snapshot: editing the returned objects
+        does not change the manager's state.
+        """
+        n = self.n_active
+        return [
+            ActiveShock(
+                event_name=self.events[event].name,
+                impact_type=self.events[event].impact_type,
+                severity=severity,
+                recovery_rate=self.events[event].recovery_rate,
+                start_month=start
+            )
+            for event, severity, start in zip(
+                self._event[:n].tolist(), self._sev[:n].tolist(),
+                self._start[:n].tolist()
+            )
+        ]
     
     def check_for_arrivals(
         self,
@@ -111,36 +295,65 @@ class RiskEventManager:
         List[ActiveShock]
             New shocks that occurred this month
         """
-        new_shocks = []
+        # Arrival counts of every event at once; events outside their
+        # active window get a zero rate
+        counts = rng.poisson(_arrival_rates_nb(
+            self._base_rates, self._first_month, self._last_month,
+            month, regime_multiplier
+        ))
         
-        for event in self.events:
-            # Check if event is active in this period
-            if month < event.start_month - 1:
-                continue
-            if event.end_month and month > event.end_month - 1:
-                continue
-            
-            # Sample arrivals with regime adjustment
-            process = self._arrival_processes[event.name]
-            effective_rate = process.base_rate * regime_multiplier
-            
-            n_arrivals = rng.poisson(effective_rate)
-            
-            for _ in range(n_arrivals):
-                # Sample severity
-                severity = event.severity_dist.sample(rng=rng)[0]
-                
-                shock = ActiveShock(
-                    event_name=event.name,
-                    impact_type=event.impact_type,
-                    severity=severity,
-                    recovery_rate=event.recovery_rate,
-                    start_month=month
-                )
-                new_shocks.append(shock)
-                self.active_shocks.append(shock)
-        
-        return new_shocks
+        arrived = np.flatnonzero(counts)
+        if arrived.size == 0:
+            return []
+        
+        # Severities of all arrivals in one draw
+        events = np.repeat(arrived, counts[arrived])
+        severities = _draw_severities(self._severity_tables, events, rng)
+        
+        self._append(events, severities, month)
+        
+        return [
+            ActiveShock(
+                event_name=self.events[i].name,
+                impact_type=self.events[i].impact_type,
+                severity=severity,
+                recovery_rate=self.events[i].recovery_rate,
+                start_month=month
+            )
+            for i, severity in zip(events.tolist(), severities.tolist())
+        ]
+    
+    def _reserve(self, needed: int) -> None:
+        """Grow the slot capacity to at least ``needed``."""
+        capacity = self._sev.size
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        
+        def grow(arr: NDArray) -> NDArray:
+            grown = np.empty(capacity, dtype=arr.dtype)
+            grown[:self.n_active] = arr[:self.n_active]
+            return grown
+        
+        self._event = grow(self._event)
+        self._sev = grow(self._sev)
+        self._rec = grow(self._rec)
+        self._impact = grow(self._impact)
+        self._start = grow(self._start)
+    
+    def _append(self, events: NDArray, severities: NDArray, month: int) -> None:
+        """Add new shocks of the given event indices after the active ones."""
+        n = self.n_active
+        self._reserve(n + events.size)
+        
+        new = slice(n, n + events.size)
+        self._event[new] = events
+        self._sev[new] = severities
+        self._rec[new] = self._event_recovery[events]
+        self._impact[new] = self._event_impact[events]
+        self._start[new] = month
+        self.n_active = n + events.size
     
     def process_recoveries(self, rng: Generator) -> int:
         """
@@ -153,19 +366,27 @@ class RiskEventManager:
         int
             Number of shocks that recovered
         """
-        recovered = 0
-        remaining = []
+        n_active = self.n_active
+        if n_active == 0:
+            return 0
         
-        for shock in self.active_shocks:
-            if rng.random() < shock.recovery_rate:
-                recovered += 1
-            else:
-                # Partial recovery: move severity toward 1.0
-                shock.severity = shock.severity + (1.0 - shock.severity) * 0.2
-                remaining.append(shock)
+        # One uniform per shock, in shock order, drawn outside the kernel
+        # so the stream is the same with or without Numba. The rest
+        # recover partially: severity moves toward 1.0.
+        keep, severity = _recovery_step_nb(
+            self._sev[:n_active], self._rec[:n_active],
+            rng.random(n_active, dtype=SHOCK_DTYPE)
+        )
         
-        self.active_shocks = remaining
-        return recovered
+        # Compact the survivors to the front, in order, within the
+        # existing buffers
+        n_kept = int(np.count_nonzero(keep))
+        self._sev[:n_kept] = severity[keep]
+        for arr in (self._event, self._rec, self._impact, self._start):
+            arr[:n_kept] = arr[:n_active][keep]
+        self.n_active = n_kept
+        
+        return n_active - n_kept
     
     def get_multipliers(self) -> Dict[str, float]:
         """
@@ -180,31 +401,239 @@ class RiskEventManager:
         Dict[str, float]
             Mapping from impact type to aggregate multiplier
         """
-        multipliers = {
-            'adoption': 1.0,
-            'churn': 1.0,
-            'revenue': 1.0,
-            'cost': 1.0
-        }
+        return dict(zip(IMPACT_TYPES, self.get_multiplier_array().tolist()))
+    
+    def get_multiplier_array(self, out: Optional[NDArray] = None) -> NDArray:
+        """
+        Aggregate multipliers as an array in ``IMPACT_TYPES`` order.
+        
+        Same values as ``get_multipliers`` without building a dict, for
+        use in per-month loops.
+        
+        Parameters
+        ----------
+        out : NDArray, optional
+            Length-4 array to write into (e.g. one row of a per-month
+            table); a new array is allocated if omitted
+        """
+        if out is None:
+            out = np.empty(len(IMPACT_TYPES))
         
-        for shock in self.active_shocks:
-            if shock.impact_type in multipliers:
-                multipliers[shock.impact_type] *= shock.severity
+        # Product per impact type as one weighted bincount of log
+        # severities: no per-shock loop, and no underflow from long runs
+        # of multiplications
+        impact = self._impact[:self.n_active]
+        known = impact >= 0
+        log_mults = np.bincount(
+            impact[known],
+            weights=_log_severities(self._sev[:self.n_active][known]),
+            minlength=len(IMPACT_TYPES)
+        )
+        np.exp(log_mults, out=out)
         
-        return multipliers
+        return out
     
     def reset(self):
         """Clear all active shocks."""
-        self.active_shocks = []
+        capacity = self.INITIAL_CAPACITY
+        self._event = np.empty(capacity, dtype=np.int64)
+        self._sev = np.empty(capacity, dtype=SHOCK_DTYPE)
+        self._rec = np.empty(capacity, dtype=SHOCK_DTYPE)
+        self._impact = np.empty(capacity, dtype=np.int64)
+        self._start = np.empty(capacity, dtype=np.int64)
+        self.n_active = 0
     
     def get_active_count(self) -> int:
         """Get number of currently active shocks."""
-        return len(self.active_shocks)
+        return self.n_active
     
     def get_active_by_type(self) -> Dict[str, int]:
         """Get count of active shocks by impact type."""
-        counts = {'adoption': 0, 'churn': 0, 'revenue': 0, 'cost': 0}
-        for shock in self.active_shocks:
-            if shock.impact_type in counts:
-                counts[shock.impact_type] += 1
-        return counts
\ No newline at end of file
+        impact = self._impact[:self.n_active]
+        counts = np.bincount(impact[impact >= 0], minlength=len(IMPACT_TYPES))
+        return dict(zip(IMPACT_TYPES, counts.tolist()))
+
+
+class BatchedRiskEventManager:
+    """
+    Risk events of many paths, stepped together.
+    
+    Same dynamics as ``RiskEventManager``, but the state of all paths is
+    held in padded ``(n_paths, capacity)`` arrays and every monthly step
+    (arrivals, recoveries, multipliers) is a handful of NumPy operations
+    over the whole batch instead of one Python call per path. Each row
+    keeps its active shocks in the first ``n_active[path]`` slots, in
+    arrival order.
+    
+    All paths draw from one shared generator, so a path's shocks are not
+    the ones a per-path ``RiskEventManager`` would draw from that path's
+    own stream; they follow the same distribution.
+    
+    Parameters
+    ----------
+    events : List[RiskEventConfig]
+        List of risk event configurations
+    n_paths : int
+        Number of paths in the batch
+    """
+    
+    # Initial shock slots per path; grown by doubling when exceeded
+    INITIAL_CAPACITY = 8
+    
+    def __init__(self, events: List[RiskEventConfig], n_paths: int):
+        self.events = events
+        self.n_paths = n_paths
+        
+        (self._base_rates, self._first_month, self._last_month,
+         self._event_impact, self._event_recovery) = _event_tables(events)
+        self._severity_tables = _severity_tables(events)
+        
+        self.reset()
+    
+    def reset(self) -> None:
+        """Clear all active shocks of every path."""
+        shape = (self.n_paths, self.INITIAL_CAPACITY)
+        self._event = np.zeros(shape, dtype=np.int64)
+        self._sev = np.ones(shape, dtype=SHOCK_DTYPE)
+        self._rec = np.zeros(shape, dtype=SHOCK_DTYPE)
+        self._impact = np.full(shape, -1, dtype=np.int64)
+        self.n_active = np.zeros(self.n_paths, dtype=np.int64)
+    
+    def _active_mask(self) -> NDArray:
+        """(n_paths, capacity) mask of the occupied slots."""
+        return np.arange(self._sev.shape[1]) < self.n_active[:, None]
+    
+    def _reserve(self, needed: int) -> None:
+        """Grow the slot capacity of every row to at least ``needed``."""
+        capacity = self._sev.shape[1]
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        extra = capacity - self._sev.shape[1]
+        
+        def grow(arr: NDArray, fill) -> NDArray:
+            pad = np.full((self.n_paths, extra), fill, dtype=arr.dtype)
+            return np.concatenate([arr, pad], axis=1)
+        
+        self._event = grow(self._event, 0)
+        self._sev = grow(self._sev, 1.0)
+        self._rec = grow(self._rec, 0.0)
+        self._impact = grow(self._impact, -1)
+    
+    def check_for_arrivals(
+        self,
+        month: int,
+        rng: Generator,
+        regime_multipliers: NDArray
+    ) -> Tuple[NDArray, NDArray, NDArray]:
+        """
+        Draw this month's new shocks for every path.
+        
+        Parameters
+        ----------
+        month : int
+            Current month
+        rng : Generator
+            Random number generator shared by the batch
+        regime_multipliers : NDArray
+            (n_paths,) multiplier on arrival intensity from each path's
+            current regime
+            
+        Returns
+        -------
+        tuple
+            (paths, events, severities) of the new shocks, ordered by
+            path, then event, then arrival
+        """
+        rates = _arrival_rates_nb(
+            self._base_rates, self._first_month, self._last_month, month, 1.0
+        )
+        counts = rng.poisson(np.multiply.outer(regime_multipliers, rates))
+        
+        total = int(counts.sum())
+        if total == 0:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty, np.empty(0, dtype=SHOCK_DTYPE)
+        
+        n_events = rates.size
+        paths, events = np.divmod(
+            np.repeat(np.arange(counts.size), counts.ravel()), n_events
+        )
+        
+        # Severities of all arrivals over every path in one draw
+        severities = _draw_severities(self._severity_tables, events, rng)
+        
+        # Append after each path's active shocks
+        per_path = counts.sum(axis=1)
+        first_new = np.cumsum(per_path) - per_path
+        slots = self.n_active[paths] + np.arange(total) - first_new[paths]
+        self._reserve(int((self.n_active + per_path).max()))
+        
+        self._event[paths, slots] = events
+        self._sev[paths, slots] = severities
+        self._rec[paths, slots] = self._event_recovery[events]
+        self._impact[paths, slots] = self._event_impact[events]
+        self.n_active += per_path
+        
+        return paths, events, severities
+    
+    def process_recoveries(self, rng: Generator) -> NDArray:
+        """
+        Process one month of recovery for every active shock.
+        
+        Returns
+        -------
+        NDArray
+            (n_paths,) number of shocks that recovered on each path
+        """
+        active = self._active_mask()
+        n_total = int(self.n_active.sum())
+        if n_total == 0:
+            return np.zeros(self.n_paths, dtype=np.int64)
+        
+        keep_active, severity = _recovery_step_nb(
+            self._sev[active], self._rec[active],
+            rng.random(n_total, dtype=SHOCK_DTYPE)
+        )
+        self._sev[active] = severity
+        
+        # Compact each row so its surviving shocks stay in order at the
+        # front (each moves left, so reading before writing is safe)
+        keep = np.zeros_like(active)
+        keep[active] = keep_active
+        rows, cols = np.nonzero(keep)
+        dest = np.cumsum(keep, axis=1)[rows, cols] - 1
+        for arr in (self._event, self._sev, self._rec, self._impact):
+            arr[rows, dest] = arr[rows, cols]
+        
+        n_before = self.n_active
+        self.n_active = keep.sum(axis=1)
+        return n_before - self.n_active
+    
+    def get_multiplier_array(self, out: Optional[NDArray] = None) -> NDArray:
+        """
+        Aggregate multipliers of every path.
+        
+        Parameters
+        ----------
+        out : NDArray, optional
+            (n_paths, 4) array to write into, columns in
+            ``IMPACT_TYPES`` order; a new array is allocated if omitted
+        """
+        if out is None:
+            out = np.empty((self.n_paths, len(IMPACT_TYPES)))
+        
+        # Sum log severities into flat (path, impact) bins, as in
+        # RiskEventManager.get_multiplier_array
+        n_types = len(IMPACT_TYPES)
+        known = self._active_mask() & (self._impact >= 0)
+        rows = np.nonzero(known)[0]
+        log_mults = np.bincount(
+            rows * n_types + self._impact[known],
+            weights=_log_severities(self._sev[known]),
+            minlength=self.n_paths * n_types
+        )
+        np.exp(log_mults.reshape(self.n_paths, n_types), out=out)
+        
+        return out
@@ -6,12 +6,19 @@ Production-ready with configurable CORS.
 """
 
 import os
+import time
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Tuple
 
 from .config import get_settings
 from .api import router
+from .api.routes import build_simulation_input
+from .api.schemas import SimulationRequest, RiskEventInput
+from .core.simulation import SimulationEngine
+from .utils.jit import NUMBA_AVAILABLE
 
 
 @asynccontextmanager
@@ -32,13 +39,55 @@ async def lifespan(app: FastAPI):
     origins = get_allowed_origins()
     print(f"CORS allowed origins: {origins}")
     
+    if settings.jit_warmup and NUMBA_AVAILABLE:
+        start = time.time()
+        # Only a head start: a failure here must not stop the server
+        try:
+            warm_up_kernels(settings.n_jobs)
+            print(f"JIT warm-up: {time.time() - start:.1f}s")
+        except Exception as e:
+            print(f"JIT warm-up failed, kernels will compile on first use: {e!r}")
+    
     yield
     
     # Shutdown
     print("Shutting down...")
 
 
-def get_allowed_origins() -> list:
+def warm_up_kernels(n_jobs: int = -1) -> None:
+    """
+    Compile the simulation kernels before the first request.
+    
+    Numba compiles each kernel on its first call, which takes several
+    seconds when its on-disk cache is cold (a fresh deploy, or a cache
+    directory that is not writable). Running and aggregating a tiny
+    simulation, with a risk event so the shock kernels run as well,
+    moves that cost to startup.
+    """
+    example = SimulationRequest.model_config['json_schema_extra']['example']
+    request = SimulationRequest(**{
+        **example,
+        'n_simulations': 2,
+        'time_horizon': 12,
+        'seed': 0,
+        'risk_events': [
+            RiskEventInput(
+                name="warm-up",
+                intensity=12,
+                impact_type="adoption",
+                severity_min=0.8,
+                severity_mode=0.9,
+                severity_max=1.0
+            )
+        ],
+    })
+    engine = SimulationEngine(build_simulation_input(request), n_jobs=n_jobs)
+    path_results, computation_time = engine.run()
+    engine.aggregate_results(path_results, computation_time)
+
+
+@lru_cache(maxsize=1)
+def get_allowed_origins() -> Tuple[str, ...]:
     """
     Get allowed CORS origins based on environment.
     
@@ -47,6 +96,9 @@ def get_allowed_origins() -> list:
     2. Default production origins
     
     Always includes localhost for development/testing.
+    
+    The environment is read once per process and the result cached;
+    it is a tuple so the shared value cannot be modified by callers.
     """
     # Check for ALLOWED_ORIGINS env var
     allowed_env = os.getenv("ALLOWED_ORIGINS", "")
@@ -76,8 +128,8 @@ def get_allowed_origins() -> list:
         "http://127.0.0.1:5174",
     ]
     
-    # Combine all origins (avoiding duplicates)
-    all_origins = list(set(origins + default_origins + localhost_origins))
+    # Combine all origins (avoiding duplicates, keeping first-seen order)
+    all_origins = tuple(dict.fromkeys(origins + default_origins + localhost_origins))
     
     return all_origins
 
@@ -0,0 +1,77 @@
+"""
+Optional Numba JIT Support.
+
+Numba compiles small numeric kernels to machine code. It is treated as
+an optional dependency: when it is not installed, the decorators below
+return the undecorated function, so every kernel still runs as plain
+Python/NumPy (slower, but with identical semantics).
+
+Kernels written against this module must therefore be valid in both
+modes:
+- ``vectorize`` kernels use NumPy ufuncs (``np.exp`` etc.) so that the
+  undecorated function still broadcasts over arrays
+- ``njit`` kernels only use NumPy features supported by Numba
+- ``prange`` falls back to the built-in ``range``
+- lists passed into kernels go through ``typed_list``
+"""
+
+from contextlib import contextmanager
+from typing import Iterable, Iterator, List
+
+try:
+    import numba
+    from numba import njit, prange, vectorize
+    from numba.typed import List as _TypedList
+    NUMBA_AVAILABLE = True
+    # Parallel kernels are launched from server worker threads. The TBB
+    # layer can hang interpreter shutdown after such launches, so prefer
+    # OpenMP (also safe for concurrent launches) when it is available.
+    numba.config.THREADING_LAYER_PRIORITY = ['omp', 'tbb', 'workqueue']
+except ImportError:  # pragma: no cover - exercised only without numba
+    NUMBA_AVAILABLE = False
+    prange = range
+    _TypedList = list
+
+    def _passthrough(*args, **kwargs):
+        # Support both bare (@njit) and configured (@njit(cache=True)) use
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+    njit = _passthrough
+    vectorize = _passthrough
+
+
+def typed_list(items: Iterable) -> List:
+    """
+    Build a list that can be passed into an ``njit`` kernel.
+    
+    Returns a ``numba.typed.List`` (plain lists are deprecated as kernel
+    arguments), or a regular list when Numba is unavailable.
+    """
+    return _TypedList(items)
+
+
+@contextmanager
+def thread_limit(n_jobs: int) -> Iterator[None]:
+    """
+    Run ``parallel=True`` kernels on at most ``n_jobs`` threads.
+    
+    Follows the usual ``n_jobs`` convention: -1 (or any value < 1) means all
+    available cores. The previous thread count is restored on exit.
+    Without Numba kernels are serial and this does nothing.
+    """
+    if not NUMBA_AVAILABLE:
+        yield
+        return
+    
+    previous = numba.get_num_threads()
+    if n_jobs >= 1:
+        numba.set_num_threads(min(n_jobs, numba.config.NUMBA_NUM_THREADS))
+    try:
+        yield
+    finally:
+        numba.set_num_threads(previous)
+
+
+__all__ = ['NUMBA_AVAILABLE', 'njit', 'prange', 'vectorize', 'typed_list', 'thread_limit']
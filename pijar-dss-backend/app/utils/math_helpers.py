@@ -6,9 +6,18 @@ the simulation and analytics modules. All functions are designed to
 be numerically stable and handle edge cases gracefully.
 """
 
+from functools import lru_cache
+
 import numpy as np
 from numpy.typing import NDArray
-from typing import Tuple, List, Optional
+from typing import Tuple, List, Optional, Union
+
+from .jit import njit
+
+try:
+    import bottleneck as bn
+except ImportError:  # pragma: no cover - exercised only without bottleneck
+    bn = None
 
 
 def percentile(data: NDArray, q: float) -> float:
@@ -52,8 +61,107 @@ def compute_quantiles(data: NDArray, quantiles: List[float]) -> dict:
     dict
         Mapping from quantile to value
     """
-    sorted_data = np.sort(data)
-    return {q: percentile(sorted_data, q) for q in quantiles}
+    values = np.percentile(data, quantiles)
+    return dict(zip(quantiles, values.tolist()))
+
+
+def sorted_percentile(
+    sorted_data: NDArray,
+    q: Union[float, List[float], NDArray]
+) -> Union[float, NDArray]:
+    """
+    Percentiles of already-sorted data, by linear interpolation.
+    
+    Gives the same values as ``np.percentile(data, q)`` but reads them
+    straight off the sorted array, so any number of percentiles (and
+    tail means, see ``tail_mean``) cost a single sort.
+    
+    Parameters
+    ----------
+    sorted_data : NDArray
+        1-D data in ascending order
+    q : float or array-like
+        Percentile(s) in range [0, 100]
+        
+    Returns
+    -------
+    float or NDArray
+        Percentile value(s), shaped like ``q``
+    """
+    n = sorted_data.shape[0]
+    pos = np.asarray(q, dtype=np.float64) / 100 * (n - 1)
+    lo = np.floor(pos).astype(np.intp)
+    hi = np.minimum(lo + 1, n - 1)
+    frac = pos - lo
+    result = sorted_data[lo] + (sorted_data[hi] - sorted_data[lo]) * frac
+    return float(result) if result.ndim == 0 else result
+
+
+def partition_percentile(
+    data: NDArray,
+    q: Union[float, List[float], NDArray]
+) -> Union[float, NDArray]:
+    """
+    Percentiles of unsorted data from a single partial sort.
+    
+    Gives the same values as ``np.percentile(data, q)``. Only the order
+    statistics that the interpolation needs are put in place, with one
+    ``np.partition`` call for all of ``q``. This is O(N) per cut point,
+    not a full sort, and is meant for data that is not otherwise sorted.
+    
+    Parameters
+    ----------
+    data : NDArray
+        1-D data
+    q : float or array-like
+        Percentile(s) in range [0, 100]
+        
+    Returns
+    -------
+    float or NDArray
+        Percentile value(s), shaped like ``q``
+    """
+    n = data.shape[0]
+    pos = np.asarray(q, dtype=np.float64) / 100 * (n - 1)
+    lo = np.floor(pos).astype(np.intp)
+    hi = np.minimum(lo + 1, n - 1)
+    part = np.partition(data, np.union1d(lo, hi))
+    result = part[lo] + (part[hi] - part[lo]) * (pos - lo)
+    return float(result) if result.ndim == 0 else result
+
+
+def tail_mean(sorted_data: NDArray, threshold: float) -> float:
+    """
+    Mean of the values >= ``threshold`` in ascending ``sorted_data``.
+    
+    Equivalent to ``data[data >= threshold].mean()`` without the mask:
+    the tail is a contiguous slice located by binary search.
+    """
+    start = np.searchsorted(sorted_data, threshold, side='left')
+    return float(sorted_data[start:].mean())
+
+
+@njit(cache=True)
+def _drawdown_nb(equity_curve: NDArray) -> Tuple[NDArray, float]:
+    """
+    Drawdown series and its maximum in a single pass.
+    
+    Tracks the running peak while walking the curve, so no running-max
+    or mask temporaries are materialized. Where the peak is not
+    positive the drawdown is defined as 0.
+    """
+    drawdown = np.empty_like(equity_curve)
+    peak = equity_curve[0]
+    max_drawdown = 0.0
+    for i in range(equity_curve.size):
+        value = equity_curve[i]
+        if value > peak:
+            peak = value
+        dd = (peak - value) / peak if peak > 0 else 0.0
+        drawdown[i] = dd
+        if dd > max_drawdown:
+            max_drawdown = dd
+    return drawdown, max_drawdown
 
 
 def compute_drawdown(equity_curve: NDArray) -> Tuple[NDArray, float]:
@@ -88,22 +196,14 @@ def compute_drawdown(equity_curve: NDArray) -> Tuple[NDArray, float]:
     0.25  # 25% drawdown from peak of 120 to trough of 90
     """
     equity_curve = np.asarray(equity_curve, dtype=np.float64)
-    
-    # Running maximum (peak)
-    running_max = np.maximum.accumulate(equity_curve)
-    
-    # Drawdown as fraction of peak
-    # Avoid division by zero
-    with np.errstate(divide='ignore', invalid='ignore'):
-        drawdown = np.where(
-            running_max > 0,
-            (running_max - equity_curve) / running_max,
-            0.0
+    if equity_curve.ndim != 1 or equity_curve.size == 0:
+        raise ValueError(
+            f"equity_curve must be a non-empty 1-D series, got shape {equity_curve.shape}"
         )
     
-    max_drawdown = float(np.max(drawdown))
+    drawdown, max_drawdown = _drawdown_nb(equity_curve)
     
-    return drawdown, max_drawdown
+    return drawdown, float(max_drawdown)
 
 
 def compute_rolling_volatility(
@@ -128,16 +228,56 @@ def compute_rolling_volatility(
     -------
     NDArray
         Rolling volatility series
+        
+    Notes
+    -----
+    Uses bottleneck's compiled ``move_std`` when it is installed, and
+    otherwise the NumPy cumulative-sum formulation below. Both keep
+    running sums, which lose precision when the values are large
+    relative to their spread (bottleneck alone: ~1e-6 relative error
+    for values near 1e9 with unit spread). The series is therefore
+    centered on its mean first, which brings either path back to
+    ~1e-13 there; a series whose level drifts by many orders of
+    magnitude more than its window-to-window spread can still lose
+    digits.
     """
-    returns = np.asarray(returns)
+    returns = np.asarray(returns, dtype=np.float64)
     n = len(returns)
     
     if n < window:
         return np.full(n, np.nan)
     
+    # The std is shift-invariant; centering keeps the running sums
+    # small (see Notes)
+    finite = np.isfinite(returns)
+    offset = returns[finite].mean() if finite.any() else 0.0
+    
+    if bn is not None:
+        # bottleneck skips NaNs but carries infinities through its running
+        # sums, so infinities are passed as NaN to keep them local too
+        centered = np.where(finite, returns - offset, np.nan)
+        return bn.move_std(centered, window=window, min_count=window, ddof=1)
+    
+    # Window sums and sums of squares as differences of cumulative sums,
+    # so every window is O(1), using the identity
+    # Var = (Σx² - (Σx)²/w) / (w - 1) on the centered values.
+    # Non-finite values are zeroed here so they cannot spread through
+    # the cumulative sums; the windows that contain one are set to NaN
+    # below.
+    centered = np.where(finite, returns - offset, 0.0)
+    c1 = np.concatenate(([0.0], np.cumsum(centered)))
+    c2 = np.concatenate(([0.0], np.cumsum(centered * centered)))
+    sum_w = c1[window:] - c1[:-window]
+    sumsq_w = c2[window:] - c2[:-window]
+    var = (sumsq_w - sum_w * sum_w / window) / (window - 1)
+    
+    # Rounding can leave a tiny negative variance for flat windows
+    vol = np.sqrt(np.maximum(var, 0.0))
+    n_bad = np.concatenate(([0], np.cumsum(~finite)))
+    vol[n_bad[window:] - n_bad[:-window] > 0] = np.nan
+    
     result = np.full(n, np.nan)
-    for i in range(window - 1, n):
-        result[i] = np.std(returns[i - window + 1:i + 1], ddof=1)
+    result[window - 1:] = vol
     
     return result
 
@@ -167,12 +307,15 @@ def safe_divide(
     numerator = np.asarray(numerator, dtype=np.float64)
     denominator = np.asarray(denominator, dtype=np.float64)
     
-    with np.errstate(divide='ignore', invalid='ignore'):
-        result = np.where(
-            np.abs(denominator) > 1e-10,
-            numerator / denominator,
-            fill_value
-        )
+    # Divide only where the denominator is usable; the other lanes keep
+    # fill_value and are never computed
+    valid = np.abs(denominator) > 1e-10
+    result = np.full(
+        np.broadcast_shapes(numerator.shape, denominator.shape),
+        fill_value,
+        dtype=np.float64
+    )
+    np.divide(numerator, denominator, out=result, where=valid)
     
     return result
 
@@ -196,14 +339,34 @@ def weighted_average(
     float
         Weighted average
     """
-    values = np.asarray(values)
-    weights = np.asarray(weights)
+    # Broadcast first so scalar or broadcastable weights keep working,
+    # then flatten both for a single dot product
+    values, weights = np.broadcast_arrays(
+        np.asarray(values, dtype=np.float64),
+        np.asarray(weights, dtype=np.float64)
+    )
+    values = values.ravel()
+    weights = weights.ravel()
     
-    total_weight = np.sum(weights)
+    total_weight = weights.sum()
     if total_weight == 0:
         return 0.0
     
-    return float(np.sum(values * weights) / total_weight)
+    # One dot product, without a values * weights temporary
+    return float(np.dot(values, weights) / total_weight)
+
+
+@lru_cache(maxsize=32)
+def _cdf_levels(n: int) -> NDArray:
+    """
+    The levels 1/n, 2/n, ..., 1 of an n-point empirical CDF.
+    
+    Cached per n and returned read-only, since repeated CDFs of the
+    same sample size (e.g. one per metric of a run) share them.
+    """
+    levels = np.linspace(1.0 / n, 1.0, n) if n else np.empty(0)
+    levels.setflags(write=False)
+    return levels
 
 
 def empirical_cdf(data: NDArray) -> Tuple[NDArray, NDArray]:
@@ -222,10 +385,29 @@ def empirical_cdf(data: NDArray) -> Tuple[NDArray, NDArray]:
     Returns
     -------
     tuple
-        (sorted_values, cumulative_probabilities)
+        (sorted_values, cumulative_probabilities); the probabilities
+        are a shared read-only array
     """
-    sorted_data = np.sort(data)
-    n = len(sorted_data)
-    cumprob = np.arange(1, n + 1) / n
+    sorted_data = np.sort(data, kind='quicksort')
+    return sorted_data, _cdf_levels(len(sorted_data))
+
+
+def empirical_cdf_inplace(data: NDArray) -> Tuple[NDArray, NDArray]:
+    """
+    ``empirical_cdf`` that sorts ``data`` in place instead of copying it.
+    
+    For callers that no longer need the original order; avoids holding
+    a second array of the sample.
     
-    return sorted_data, cumprob
\ No newline at end of file
+    Parameters
+    ----------
+    data : NDArray
+        1-D sample data; reordered by the call
+        
+    Returns
+    -------
+    tuple
+        (data, cumulative_probabilities)
+    """
+    data.sort(kind='quicksort')
+    return data, _cdf_levels(len(data))
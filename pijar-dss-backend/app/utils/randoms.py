@@ -13,7 +13,7 @@ parallel stream management.
 
 import numpy as np
 from numpy.random import Generator, PCG64, SeedSequence
-from typing import Optional, List
+from typing import Iterator, List, Optional, Union
 
 
 class RNGManager:
@@ -57,7 +57,11 @@ class RNGManager:
         """Get the primary random number generator."""
         return self._rng
     
-    def spawn_generators(self, n: int) -> List[Generator]:
+    def spawn_generators(
+        self,
+        n: int,
+        lazy: bool = False
+    ) -> Union[List[Generator], Iterator[Generator]]:
         """
         Spawn n independent random number generators for parallel use.
         
@@ -70,11 +74,15 @@ class RNGManager:
         ----------
         n : int
             Number of independent generators to create
+        lazy : bool
+            If True, return an iterator that builds each Generator only
+            when it is reached. The child seeds are still spawned up
+            front, so the streams are the same as with ``lazy=False``.
             
         Returns
         -------
-        List[Generator]
-            List of independent Generator objects
+        List[Generator] or Iterator[Generator]
+            Independent Generator objects
             
         Example
         -------
@@ -85,7 +93,42 @@ class RNGManager:
         [0.7739..., 0.4388..., 0.0596..., 0.8650...]
         """
         child_sequences = self.seed_sequence.spawn(n)
-        return [Generator(PCG64(seq)) for seq in child_sequences]
+        generators = (Generator(PCG64(seq)) for seq in child_sequences)
+        return generators if lazy else list(generators)
+    
+    def jumped_generators(self, n: int) -> List[Generator]:
+        """
+        Create n non-overlapping generators by PCG64 jump-ahead.
+        
+        Stream ``k`` (0-based) is the primary stream advanced by
+        ``k + 1`` jumps of 2^127 draws, so none of them overlaps the
+        primary ``rng``. This is one jump further than
+        ``SimulationEngine.make_path_rngs``, whose path ``i`` is the base
+        stream advanced by ``i`` jumps: with the same seed, stream ``k``
+        here equals path ``k + 1`` there. Creation costs about the same
+        as ``spawn_generators``.
+        
+        Unlike ``spawn_generators``, calling this again returns the same
+        streams, and the streams depend on ``n`` only through their
+        count: the first k of ``jumped_generators(n)`` equal
+        ``jumped_generators(k)``.
+        
+        Parameters
+        ----------
+        n : int
+            Number of generators to create
+            
+        Returns
+        -------
+        List[Generator]
+            Generators in stream order
+        """
+        bit_generator = PCG64(self.seed_sequence)
+        generators = []
+        for _ in range(n):
+            bit_generator = bit_generator.jumped()
+            generators.append(Generator(bit_generator))
+        return generators
     
     def reset(self) -> None:
         """
@@ -0,0 +1,44 @@
+"""Tests for the jump-diffusion process."""
+
+import numpy as np
+import pytest
+
+from app.core.processes.jump_diffusion import JumpDiffusionProcess
+
+
+def _process():
+    return JumpDiffusionProcess(
+        drift=0.02, volatility=0.3, jump_intensity=0.5, jump_mean=-0.2, jump_std=0.3
+    )
+
+
+@pytest.mark.parametrize("initial_state", [0.0, -100.0])
+def test_non_positive_start_gives_zeros(initial_state):
+    process = _process()
+    rng = np.random.default_rng(0)
+
+    assert process.step(initial_state, 0, rng) == 0.0
+
+    path = process.simulate_path(initial_state, 12, rng)
+    assert path[0] == initial_state
+    np.testing.assert_array_equal(path[1:], 0.0)
+
+    paths = process.simulate_paths(initial_state, 4, 12, rng)
+    np.testing.assert_array_equal(paths[:, 0], initial_state)
+    np.testing.assert_array_equal(paths[:, 1:], 0.0)
+
+    full, diffusion, jump_times = process.decompose_path(initial_state, 12, rng)
+    assert full[0] == diffusion[0] == initial_state
+    np.testing.assert_array_equal(full[1:], 0.0)
+    np.testing.assert_array_equal(diffusion[1:], 0.0)
+    assert jump_times.size == 0
+
+
+def test_positive_start_stays_positive():
+    process = _process()
+    rng = np.random.default_rng(1)
+
+    assert (process.simulate_path(100.0, 120, rng) > 0).all()
+    assert (process.simulate_paths(100.0, 50, 120, rng) > 0).all()
+    full, diffusion, _ = process.decompose_path(100.0, 120, rng)
+    assert (full > 0).all() and (diffusion > 0).all()
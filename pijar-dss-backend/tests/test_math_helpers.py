@@ -0,0 +1,114 @@
+"""Tests for app.utils.math_helpers."""
+
+import numpy as np
+import pytest
+
+from app.utils.math_helpers import (
+    compute_drawdown, partition_percentile, sorted_percentile, weighted_average
+)
+
+
+QUANTILES = [0, 1, 5, 25, 33.3, 50, 75, 95, 99, 100]
+
+
+@pytest.mark.parametrize("n", [1, 2, 7, 500, 1001])
+def test_sorted_percentile_matches_numpy(n):
+    data = np.random.default_rng(n).normal(size=n)
+    sorted_data = np.sort(data)
+
+    np.testing.assert_allclose(
+        sorted_percentile(sorted_data, QUANTILES), np.percentile(data, QUANTILES),
+        rtol=1e-12, atol=1e-12
+    )
+    for q in QUANTILES:
+        result = sorted_percentile(sorted_data, q)
+        assert isinstance(result, float)
+        assert result == pytest.approx(np.percentile(data, q), rel=1e-12, abs=1e-12)
+
+
+@pytest.mark.parametrize("n", [1, 2, 7, 500, 1001])
+def test_partition_percentile_matches_numpy(n):
+    data = np.random.default_rng(n).lognormal(size=n)
+    original = data.copy()
+
+    np.testing.assert_allclose(
+        partition_percentile(data, QUANTILES), np.percentile(data, QUANTILES),
+        rtol=1e-12, atol=1e-12
+    )
+    for q in QUANTILES:
+        result = partition_percentile(data, q)
+        assert isinstance(result, float)
+        assert result == pytest.approx(np.percentile(data, q), rel=1e-12, abs=1e-12)
+    # The input is left untouched
+    np.testing.assert_array_equal(data, original)
+
+
+def test_percentiles_with_ties():
+    data = np.repeat([3.0, -1.0, 2.0], 50)
+    expected = np.percentile(data, QUANTILES)
+    np.testing.assert_allclose(sorted_percentile(np.sort(data), QUANTILES), expected)
+    np.testing.assert_allclose(partition_percentile(data, QUANTILES), expected)
+
+
+def test_weighted_average_matches_sum_formula():
+    rng = np.random.default_rng(0)
+    values, weights = rng.normal(size=50), rng.random(50)
+    assert weighted_average(values, weights) == pytest.approx(
+        np.sum(values * weights) / np.sum(weights), rel=1e-12
+    )
+    assert weighted_average(values.reshape(5, 10), weights.reshape(5, 10)) == pytest.approx(
+        np.sum(values * weights) / np.sum(weights), rel=1e-12
+    )
+    assert weighted_average([1, 2, 3], [0, 0, 0]) == 0.0
+
+
+def test_weighted_average_broadcasts_weights():
+    # A constant weight gives the plain mean
+    assert weighted_average([1.0, 2.0, 3.0], 2.0) == pytest.approx(2.0)
+    assert weighted_average(np.arange(6.0), np.ones(1)) == pytest.approx(2.5)
+
+    # One weight per column of a 2-D array
+    values = np.arange(6.0).reshape(2, 3)
+    weights = np.array([1.0, 0.0, 3.0])
+    full = np.broadcast_to(weights, values.shape)
+    assert weighted_average(values, weights) == pytest.approx(
+        np.sum(values * full) / np.sum(full)
+    )
+
+    with pytest.raises(ValueError):
+        weighted_average([1.0, 2.0, 3.0], [1.0, 2.0])
+
+
+def _drawdown_reference(equity_curve):
+    """The running-max formulation compute_drawdown replaced."""
+    running_max = np.maximum.accumulate(equity_curve)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        drawdown = np.where(running_max > 0, (running_max - equity_curve) / running_max, 0.0)
+    return drawdown, float(np.max(drawdown))
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_compute_drawdown_bit_identical(seed):
+    rng = np.random.default_rng(seed)
+    # Random walks that start positive and often go below zero
+    equity = 100 + np.cumsum(rng.normal(0, 30, size=120))
+    drawdown, max_drawdown = compute_drawdown(equity)
+    expected, expected_max = _drawdown_reference(equity)
+    np.testing.assert_array_equal(drawdown, expected)
+    assert max_drawdown == expected_max
+
+
+def test_compute_drawdown_example_and_non_positive_peak():
+    drawdown, max_drawdown = compute_drawdown([100, 110, 105, 120, 90, 115])
+    assert max_drawdown == pytest.approx(0.25)
+    assert drawdown[0] == 0.0
+
+    drawdown, max_drawdown = compute_drawdown([-5.0, -3.0, -4.0, 0.0])
+    np.testing.assert_array_equal(drawdown, 0.0)
+    assert max_drawdown == 0.0
+
+
+@pytest.mark.parametrize("equity", [[], np.ones((2, 3))])
+def test_compute_drawdown_rejects_empty_and_2d(equity):
+    with pytest.raises(ValueError):
+        compute_drawdown(equity)
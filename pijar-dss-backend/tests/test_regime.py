@@ -0,0 +1,71 @@
+"""Tests for the regime-switching model."""
+
+import numpy as np
+import pytest
+from scipy import sparse as sp
+
+from app.core.processes.regime import RegimeSwitchingModel
+
+
+# Each regime reaches only its neighbours, so the matrix has zeros
+BANDED = np.array([
+    [0.90, 0.10, 0.00],
+    [0.20, 0.70, 0.10],
+    [0.00, 0.30, 0.70],
+])
+
+
+@pytest.mark.parametrize("matrix", [BANDED, sp.csr_matrix(BANDED)], ids=["dense", "csr"])
+def test_sparse_regime_paths_match_dense(matrix):
+    dense = RegimeSwitchingModel(transition_matrix=BANDED)
+    sparse = RegimeSwitchingModel(transition_matrix=matrix, sparse=True)
+
+    np.testing.assert_array_equal(
+        sparse.simulate_regime_indices(500, np.random.default_rng(7)),
+        dense.simulate_regime_indices(500, np.random.default_rng(7)),
+    )
+    assert (
+        sparse.simulate_regime_path(60, np.random.default_rng(8))
+        == dense.simulate_regime_path(60, np.random.default_rng(8))
+    )
+
+    rng_dense, rng_sparse = np.random.default_rng(9), np.random.default_rng(9)
+    for current in [0, 1, 2] * 100:
+        assert sparse.sample_next_index(current, rng_sparse) == dense.sample_next_index(current, rng_dense)
+
+    dense_pi = dense.compute_stationary_distribution()
+    for regime, p in sparse.compute_stationary_distribution().items():
+        assert p == pytest.approx(dense_pi[regime], abs=1e-12)
+
+
+def _eig_stationary(matrix):
+    eigenvalues, eigenvectors = np.linalg.eig(matrix.T)
+    pi = np.real(eigenvectors[:, np.argmin(np.abs(eigenvalues - 1.0))])
+    return pi / pi.sum()
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_closed_form_stationary_matches_eigensolver(seed):
+    rng = np.random.default_rng(seed)
+    matrix = rng.dirichlet(np.ones(3), size=3)
+    model = RegimeSwitchingModel(transition_matrix=matrix)
+
+    pi = np.array(list(model.compute_stationary_distribution().values()))
+    np.testing.assert_allclose(pi, _eig_stationary(matrix), atol=1e-12)
+    np.testing.assert_allclose(pi @ matrix, pi, atol=1e-12)
+
+
+@pytest.mark.parametrize("matrix", [BANDED, RegimeSwitchingModel.create_default().transition_matrix])
+def test_closed_form_stationary_matches_eigensolver_for_model_chains(matrix):
+    model = RegimeSwitchingModel(transition_matrix=matrix)
+    pi = np.array(list(model.compute_stationary_distribution().values()))
+    np.testing.assert_allclose(pi, _eig_stationary(matrix), atol=1e-12)
+
+
+def test_stationary_falls_back_when_minors_vanish():
+    # Absorbing chain without a unique stationary law: all minors are 0
+    model = RegimeSwitchingModel(transition_matrix=np.eye(3))
+    pi = np.array(list(model.compute_stationary_distribution().values()))
+    assert pi.sum() == pytest.approx(1.0)
+    assert (pi >= 0).all()
+    np.testing.assert_allclose(pi @ np.eye(3), pi)
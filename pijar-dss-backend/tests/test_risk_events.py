@@ -0,0 +1,58 @@
+"""Tests for the risk event managers."""
+
+import numpy as np
+
+from app.core.distributions import TriangularDistribution
+from app.core.simulation.risk_events import (
+    IMPACT_TYPES, BatchedRiskEventManager, Impact, RiskEventConfig, RiskEventManager
+)
+
+
+def _events():
+    return [
+        RiskEventConfig('regulation', 6, 'churn', TriangularDistribution(1.1, 1.3, 1.6), 0.2,
+                        start_month=3, end_month=9),
+        RiskEventConfig('downturn', 12, 'adoption', TriangularDistribution(0.5, 0.6, 0.9), 0.1),
+        RiskEventConfig('unknown', 12, 'other', TriangularDistribution(0.5, 0.6, 0.9), 0.2),
+        RiskEventConfig('inflation', 3, 'cost', TriangularDistribution(1.0, 1.2, 1.5), 0.05),
+    ]
+
+
+def test_single_path_batch_matches_manager():
+    """With one path the batched manager consumes the stream identically."""
+    events = _events()
+    manager = RiskEventManager(events)
+    batched = BatchedRiskEventManager(events, 1)
+    rng_single = np.random.default_rng(5)
+    rng_batched = np.random.default_rng(5)
+
+    for month in range(36):
+        intensity_mult = 1.0 + 0.5 * (month % 3)
+
+        arrivals = manager.check_for_arrivals(month, rng_single, intensity_mult)
+        _, _, severities = batched.check_for_arrivals(
+            month, rng_batched, np.array([intensity_mult])
+        )
+        assert [shock.severity for shock in arrivals] == severities.tolist()
+
+        assert manager.process_recoveries(rng_single) == batched.process_recoveries(rng_batched)[0]
+        np.testing.assert_array_equal(
+            manager.get_multiplier_array(), batched.get_multiplier_array()[0]
+        )
+
+    assert manager.get_active_count() == batched.n_active[0]
+    # Both generators end in the same state
+    assert rng_single.random() == rng_batched.random()
+
+
+def test_impact_codes_match_exact_lowercase_names():
+    assert [Impact.code(name) for name in IMPACT_TYPES] == list(range(len(Impact)))
+    for name in ('Churn', 'COST', 'other', ''):
+        assert Impact.code(name) == -1
+
+    # A type that is not an exact name affects no multiplier
+    config = RiskEventConfig('shock', 12, 'Churn', TriangularDistribution(1.5, 1.8, 2.0), 0.0)
+    manager = RiskEventManager([config])
+    manager.check_for_arrivals(0, np.random.default_rng(0), 5.0)
+    assert manager.get_active_count() > 0
+    np.testing.assert_array_equal(manager.get_multiplier_array(), 1.0)
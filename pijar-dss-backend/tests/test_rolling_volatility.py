@@ -0,0 +1,70 @@
+"""Tests for compute_rolling_volatility."""
+
+import numpy as np
+import pytest
+
+from app.utils import math_helpers
+from app.utils.math_helpers import compute_rolling_volatility
+
+
+def _reference(returns, window):
+    """The per-window loop: std (ddof=1) of each full window."""
+    result = np.full(len(returns), np.nan)
+    for i in range(window - 1, len(returns)):
+        result[i] = np.std(returns[i - window + 1:i + 1], ddof=1)
+    return result
+
+
+@pytest.fixture(params=['numpy', 'bottleneck'])
+def backend(request, monkeypatch):
+    """Run a test on the NumPy fallback and, when installed, on bottleneck."""
+    if request.param == 'numpy':
+        monkeypatch.setattr(math_helpers, 'bn', None)
+    elif math_helpers.bn is None:
+        pytest.skip("bottleneck is not installed")
+    return request.param
+
+
+@pytest.mark.usefixtures('backend')
+@pytest.mark.parametrize("window", [2, 5, 12])
+def test_matches_reference(window):
+    returns = np.random.default_rng(window).normal(0.01, 0.05, size=60)
+    np.testing.assert_allclose(
+        compute_rolling_volatility(returns, window), _reference(returns, window),
+        rtol=1e-10, atol=1e-15
+    )
+
+
+@pytest.mark.usefixtures('backend')
+def test_short_series_is_all_nan():
+    assert np.isnan(compute_rolling_volatility(np.ones(5), window=12)).all()
+
+
+@pytest.mark.usefixtures('backend')
+@pytest.mark.parametrize("bad", [np.nan, np.inf, -np.inf])
+def test_non_finite_returns_stay_local(bad):
+    window = 5
+    returns = np.random.default_rng(0).normal(size=40)
+    returns[10] = bad
+    returns[25] = bad
+
+    vol = compute_rolling_volatility(returns, window)
+
+    # Only the windows containing a bad value are NaN
+    affected = np.zeros(40, dtype=bool)
+    affected[:window - 1] = True
+    for i in (10, 25):
+        affected[i:i + window] = True
+    np.testing.assert_array_equal(np.isnan(vol), affected)
+    np.testing.assert_allclose(vol[~affected], _reference(returns, window)[~affected], rtol=1e-10)
+
+
+@pytest.mark.usefixtures('backend')
+@pytest.mark.parametrize("level", [1e6, 1e9])
+def test_precise_for_large_mean(level):
+    # Unit spread around a large level: running sums of the raw values
+    # would lose most of the digits
+    returns = level + np.random.default_rng(1).normal(size=200)
+    np.testing.assert_allclose(
+        compute_rolling_volatility(returns, 12)[11:], _reference(returns, 12)[11:], rtol=1e-8
+    )
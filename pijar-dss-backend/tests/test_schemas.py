@@ -0,0 +1,31 @@
+"""Tests for the float32 path fields of the result models."""
+
+import json
+
+import numpy as np
+
+from app.api.schemas import PathDataResponse
+from app.core.models.results import PathData
+
+
+def test_path_arrays_are_float32_and_dump_shortest_decimals():
+    data = PathData(percentiles=[], median_path=[5234.7427, 1.1], sample_paths=[[0.1, 0.2]])
+    assert data.median_path.dtype == np.float32
+    assert data.sample_paths.dtype == np.float32
+
+    dumped = json.loads(data.model_dump_json())
+    assert dumped['median_path'] == [5234.7427, 1.1]
+    assert dumped['sample_paths'] == [[0.1, 0.2]]
+    assert PathData(percentiles=[], median_path=[]).model_dump_json().count('null') == 1
+
+
+def test_missing_sample_paths_dump_as_empty_list():
+    response = PathDataResponse(percentiles=[], sample_paths=None, median_path=np.zeros(3))
+    assert json.loads(response.model_dump_json())['sample_paths'] == []
+
+
+def test_path_arrays_documented_as_float_lists():
+    for mode in ('validation', 'serialization'):
+        properties = PathDataResponse.model_json_schema(mode=mode)['properties']
+        assert properties['median_path']['items'] == {'type': 'number'}
+        assert properties['sample_paths']['items'] == {'type': 'array', 'items': {'type': 'number'}}